@@ -0,0 +1,86 @@
+"""Benchmark the decoding of a maximum-size snapshot in each wire format offered to the shim server.
+
+The snapshot holds the payloads of every endpoint of the largest topology (48 zones, 3 mixed
+groups, 5 pumps, 9 dehumidifiers and the global endpoints), each decoded on its own as the
+HTTP transport does. Run from the repository root:
+
+    python benchmarks/bench_decode.py [--rounds N] | tee bench_output.txt
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.rehau_neasmart2.hub import _wire_decoders  # noqa: E402
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+# Build the payloads served by the shim server for the largest topology.
+def max_snapshot(seed: int = 0) -> dict[str, dict]:
+    """Return the endpoint -> payload mapping of a maximum-size topology."""
+    rnd = random.Random(seed)
+    snapshot = {
+        "mode": {"mode": 2},
+        "state": {"state": 1},
+        "outsidetemperature": {"outside_temperature": 7.42, "filtered_outside_temperature": 7.6},
+        "notifications": {"hints_present": False, "warnings_present": False, "error_present": False},
+    }
+    for m in range(1, 4):
+        snapshot[f"mixedgroups/{m}"] = {
+            "pump_state": 1, "mixing_valve_opening_percentage": rnd.randint(0, 100),
+            "flow_temperature": round(rnd.uniform(25, 40), 2), "return_temperature": round(rnd.uniform(20, 30), 2),
+        }
+    for p in range(1, 6):
+        snapshot[f"pumps/{p}"] = {"pump_state": rnd.randint(0, 1)}
+    for d in range(1, 10):
+        snapshot[f"dehumidifiers/{d}"] = {"dehumidifier_state": rnd.randint(0, 1)}
+    for b in range(1, 5):
+        for z in range(1, 13):
+            snapshot[f"zones/{b}/{z}"] = {
+                "state": rnd.randint(1, 3), "setpoint": round(rnd.uniform(18, 23) * 2) / 2,
+                "temperature": round(rnd.uniform(17, 24), 2), "relative_humidity": rnd.randint(30, 65),
+            }
+    return snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    snapshot = max_snapshot()
+    decoders = _wire_decoders()
+    formats = {"application/json": (lambda payload: json.dumps(payload).encode(), json.loads)}
+    if msgpack is not None:
+        formats["application/msgpack"] = (msgpack.packb, decoders["application/msgpack"])
+    if cbor2 is not None:
+        formats["application/cbor"] = (cbor2.dumps, decoders["application/cbor"])
+
+    print(f"{len(snapshot)} endpoints per snapshot, {args.rounds} rounds")
+    for content_type, (encode, decode) in formats.items():
+        bodies = [encode(payload) for payload in snapshot.values()]
+        assert [decode(body) for body in bodies] == list(snapshot.values())
+        elapsed = timeit.timeit(lambda: [decode(body) for body in bodies], number=args.rounds)
+        print("{:<20} {:>6} bytes, {:>8.1f} us per snapshot".format(
+            content_type, sum(map(len, bodies)), elapsed / args.rounds * 1e6))
+    missing = [name for name, module in (("msgpack", msgpack), ("cbor2", cbor2)) if module is None]
+    if missing:
+        print("not installed: " + ", ".join(missing))
+
+
+if __name__ == "__main__":
+    main()
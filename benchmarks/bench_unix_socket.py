@@ -0,0 +1,70 @@
+"""Benchmark the HTTP transport towards the shim server over a Unix domain socket against TCP loopback.
+
+Both servers are the stand-in shim server of the tests, serving a zone payload without ETag so
+every request is a full 200 answer. Run from the repository root:
+
+    python benchmarks/bench_unix_socket.py [--requests N] [--threads T] | tee bench_output.txt
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2HttpTransport  # noqa: E402
+from tests.shim_server import ShimServer  # noqa: E402
+
+ZONE = {"state": 1, "setpoint": 21.5, "temperature": 20.3, "relative_humidity": 45}
+
+
+# Time each GET sent through the transport, from several threads sharing its connection pool.
+def measure(transport: RehauNeasmart2HttpTransport, requests: int, threads: int) -> list[float]:
+    """Return the latency (seconds) of each request."""
+    def timed(_) -> float:
+        start = time.perf_counter()
+        payload, _ = transport.get("zones/1/1")
+        assert payload is not None
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(timed, range(requests)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "gateway.sock")
+        with ShimServer({"zones/1/1": ZONE}, etags=False) as tcp, \
+                ShimServer({"zones/1/1": ZONE}, socket_path=socket_path, etags=False) as unix:
+            results = {}
+            for name, transport in (
+                ("tcp", RehauNeasmart2HttpTransport(tcp.base_url)),
+                ("unix", RehauNeasmart2HttpTransport("", socket_path)),
+            ):
+                # Open the connections before timing.
+                measure(transport, 100, args.threads)
+                start = time.perf_counter()
+                latencies = measure(transport, args.requests, args.threads)
+                elapsed = time.perf_counter() - start
+                transport.close()
+                latencies.sort()
+                results[name] = statistics.mean(latencies)
+                print("{:<5} {:>6} requests, {} threads: mean {:.3f} ms, p50 {:.3f} ms, p99 {:.3f} ms, "
+                      "{:.0f} req/s".format(name, args.requests, args.threads, results[name] * 1000,
+                                            latencies[len(latencies) // 2] * 1000,
+                                            latencies[int(len(latencies) * 0.99)] * 1000, args.requests / elapsed))
+    print("unix/tcp mean latency ratio: {:.2f}".format(results["unix"] / results["tcp"]))
+
+
+if __name__ == "__main__":
+    main()
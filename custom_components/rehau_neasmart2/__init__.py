@@ -4,9 +4,18 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers.storage import Store
 from . import hub
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    MODBUS_DEFAULT_BAUDRATE,
+    MODBUS_DEFAULT_SLAVE_ID,
+    TRANSPORT_HTTP,
+    WRITE_QUEUE_STORAGE_KEY,
+    WRITE_QUEUE_STORAGE_VERSION
+)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CLIMATE, Platform.SELECT]
 
@@ -14,26 +23,49 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CLIMATE, Platform.SELECT]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rehau Neasmart 2.0 from a config entry."""
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub.RehauNeasmart2ClimateControlSystem(
-        hass,
-        entry.data["climate_system_name"],
-        entry.data["neasmart_gw_server_host"],
-        entry.data["neasmart_gw_server_port"],
-        entry.data["zones"],
-        entry.data.get("mixed_groups", 0),
-        entry.data.get("pumps_regs_mapping", ""),
-        entry.data.get("dehumidificators_regs_mapping", "")
-    )
+    try:
+        neasmart_hub = hub.RehauNeasmart2ClimateControlSystem(
+            hass,
+            entry.data["climate_system_name"],
+            entry.data["neasmart_gw_server_host"],
+            entry.data["neasmart_gw_server_port"],
+            entry.data["zones"],
+            entry.data.get("mixed_groups", 0),
+            entry.data.get("pumps_regs_mapping", ""),
+            entry.data.get("dehumidificators_regs_mapping", ""),
+            transport=entry.data.get("transport", TRANSPORT_HTTP),
+            modbus_serial_port=entry.data.get("modbus_serial_port"),
+            modbus_baudrate=entry.data.get("modbus_baudrate", MODBUS_DEFAULT_BAUDRATE),
+            modbus_slave_id=entry.data.get("modbus_slave_id", MODBUS_DEFAULT_SLAVE_ID)
+        )
+    except hub.ModbusUnavailable as err:
+        # Retrying cannot help until pymodbus is installed in the Home Assistant environment.
+        raise ConfigEntryError(str(err)) from err
+    neasmart_hub.async_apply_options(entry.options)
+    await neasmart_hub.async_setup(entry.entry_id)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = neasmart_hub
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the updated options to the running hub, without reloading the entry."""
+    hass.data[DOMAIN][entry.entry_id].async_apply_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        neasmart_hub = hass.data[DOMAIN].pop(entry.entry_id)
+        await neasmart_hub.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the writes still queued for a deleted config entry, along with their storage file."""
+    await Store(hass, WRITE_QUEUE_STORAGE_VERSION, WRITE_QUEUE_STORAGE_KEY.format(entry.entry_id)).async_remove()
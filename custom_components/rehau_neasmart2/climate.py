@@ -1,13 +1,46 @@
 import logging
-from .const import DOMAIN, PRESET_STATES_MAPPING, PRESET_STATES_MAPPING_REVERSE
-from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature, HVACMode
+from .const import (
+    DOMAIN,
+    PRESET_CLIMATE_MODES_MAPPING,
+    PRESET_STATES_MAPPING,
+    PRESET_STATES_MAPPING_REVERSE,
+    SIGNAL_ZONES_REFRESHED
+)
+from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature, HVACAction, HVACMode
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import callback
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields of the zone payload mapped to the climate entity.
+ZONE_FIELDS = ("state", "relative_humidity", "temperature", "setpoint")
+# Global modes in which the zones are cooled rather than heated.
+COOLING_MODES = (PRESET_CLIMATE_MODES_MAPPING["Cooling"], PRESET_CLIMATE_MODES_MAPPING["Forced Cooling"])
+
+
+# Derives what a zone is actually doing from the data the hub already holds, without polling.
+def derive_hvac_action(hub, state: int | None, temperature: float | None, setpoint: float | None) -> HVACAction | None:
+    """Return the HVAC action of a zone from its state and the last global mode, state and pumps read by the hub."""
+    standby = PRESET_STATES_MAPPING["Standby"]
+    if state == standby or hub.cached_data("state", "state") == standby:
+        return HVACAction.OFF
+    if temperature is None or setpoint is None:
+        return None
+    cooling = hub.cached_data("mode", "mode") in COOLING_MODES
+    if (temperature > setpoint) if cooling else (temperature < setpoint):
+        # The zone calls for energy, check a circuit is delivering it when the pumps or valves were read.
+        circuits = [hub.cached_data(mixg.endpoint, "pump_state") for mixg in hub.mixgs] + \
+            [hub.cached_data(mixg.endpoint, "mixing_valve_opening_percentage") for mixg in hub.mixgs] + \
+            [hub.cached_data(pump.endpoint, "pump_state") for pump in hub.pumps]
+        circuits = [activity for activity in circuits if activity is not None]
+        if not circuits or any(circuits):
+            return HVACAction.COOLING if cooling else HVACAction.HEATING
+    return HVACAction.IDLE
+
 # Asynchronously sets up the climate entities for the given configuration entry in Home Assistant.
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Add sensors for passed config_entry in HA."""
@@ -57,31 +90,56 @@ class RehauNeasmart2ZoneClimateEntity(RehauNeasmart2GenericClimateEntity):
         self._attr_current_humidity = None
         self._attr_current_temperature = None
         self._attr_target_temperature = None
+        self._attr_hvac_action = None
+
+    # Subscribes to the bulk zones refreshes triggered by global changes, and adds the zone to the poll plan.
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._device.hub.async_add_consumer([self._device.endpoint]))
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_ZONES_REFRESHED.format(self._device.hub.id), self._handle_zones_refreshed
+        ))
 
-    # Asynchronously updates the climate entity's state based on the zone data.
+    # Updates the entity from the freshly re-read zone data.
+    @callback
+    def _handle_zones_refreshed(self) -> None:
+        self.async_schedule_update_ha_state(True)
+
+    # Asynchronously updates the climate entity's state based on the zone data, keeping the last value of the
+    # missing fields.
     async def async_update(self) -> None:
         zone_data = await self._device.get_zone_data()
-        if zone_data is not None and \
-                zone_data.get("state") is not None and \
-                zone_data.get("relative_humidity") is not None and \
-                zone_data.get("temperature") is not None and \
-                zone_data.get("setpoint") is not None:
-            self._attr_preset_mode = PRESET_STATES_MAPPING_REVERSE[zone_data["state"]]
+        if zone_data is None:
+            self._device.hub.errors.log(
+                _LOGGER, self._attr_unique_id, "Error updating %s thermostat", self._attr_unique_id
+            )
+            return
+        if zone_data.get("state") is not None:
+            self._attr_preset_mode = PRESET_STATES_MAPPING_REVERSE.get(zone_data["state"])
+        if zone_data.get("relative_humidity") is not None:
             self._attr_current_humidity = zone_data["relative_humidity"]
+        if zone_data.get("temperature") is not None:
             self._attr_current_temperature = zone_data["temperature"]
+        if zone_data.get("setpoint") is not None:
             self._attr_target_temperature = zone_data["setpoint"]
-        else:
-            _LOGGER.error(f"Error updating {self._attr_unique_id} thermostat")
+        self._attr_hvac_action = derive_hvac_action(
+            self._device.hub, PRESET_STATES_MAPPING.get(self._attr_preset_mode),
+            self._attr_current_temperature, self._attr_target_temperature
+        )
+        missing = [key for key in ZONE_FIELDS if zone_data.get(key) is None]
+        if missing:
+            self._device.hub.errors.log(
+                _LOGGER, self._attr_unique_id, "Partial update of %s thermostat, missing %s",
+                self._attr_unique_id, ", ".join(missing)
+            )
 
     # Asynchronously sets the preset mode for the climate entity.
     async def async_set_preset_mode(self, preset_mode: str):
-        if not await self._device.set_zone_state(PRESET_STATES_MAPPING[preset_mode]):
-            _LOGGER.error(f"Error setting preset mode for {self._attr_unique_id} thermostat")
+        await self._device.set_zone_state(PRESET_STATES_MAPPING[preset_mode])
 
     # Asynchronously sets the target temperature for the climate entity.
     async def async_set_temperature(self, **kwargs):
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        if not await self._device.set_zone_setpoint(temperature):
-            _LOGGER.error(f"Error setting temperature setpoint for {self._attr_unique_id} thermostat")
\ No newline at end of file
+        await self._device.set_zone_setpoint(temperature)
\ No newline at end of file
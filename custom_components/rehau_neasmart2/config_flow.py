@@ -2,18 +2,38 @@
 from __future__ import annotations
 
 import logging
+import os
+import stat
+import time
 from typing import Any
 
 import requests
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from . import hub
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_OPTIONS,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS_LIMIT,
+    MODBUS_DEFAULT_BAUDRATE,
+    MODBUS_DEFAULT_SLAVE_ID,
+    OPTION_CADENCE_PROBE_INTERVAL,
+    OPTION_HUMIDITY_DEADBAND,
+    OPTION_MAX_CONCURRENT_REQUESTS,
+    OPTION_REQUEST_TIMEOUT,
+    OPTION_TEMPERATURE_DEADBAND,
+    OPTION_WRITE_RETRY_INTERVAL,
+    OPTION_ZONES_POLL_INTERVAL,
+    TRANSPORT_HTTP,
+    TRANSPORT_MODBUS_RTU,
+    TRANSPORTS,
+    VALIDATION_DEADLINE
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,9 +47,36 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Optional("mixed_groups"): int,
         vol.Optional("dehumidificators_regs_mapping"): str,
         vol.Optional("pumps_regs_mapping"): str,
+        vol.Optional("transport", default=TRANSPORT_HTTP): vol.In(TRANSPORTS),
+        vol.Optional("modbus_serial_port"): str,
+        vol.Optional("modbus_baudrate", default=MODBUS_DEFAULT_BAUDRATE): int,
+        vol.Optional("modbus_slave_id", default=MODBUS_DEFAULT_SLAVE_ID): int,
     }
 )
 
+# Build the schema of the options, defaulting to their current values.
+def options_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the options schema pre-filled with the given options."""
+    options = {**DEFAULT_OPTIONS, **options}
+    return vol.Schema(
+        {
+            vol.Required(OPTION_ZONES_POLL_INTERVAL, default=options[OPTION_ZONES_POLL_INTERVAL]):
+                vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+            vol.Required(OPTION_CADENCE_PROBE_INTERVAL, default=options[OPTION_CADENCE_PROBE_INTERVAL]):
+                vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Required(OPTION_WRITE_RETRY_INTERVAL, default=options[OPTION_WRITE_RETRY_INTERVAL]):
+                vol.All(vol.Coerce(int), vol.Range(min=5, max=600)),
+            vol.Required(OPTION_MAX_CONCURRENT_REQUESTS, default=options[OPTION_MAX_CONCURRENT_REQUESTS]):
+                vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENT_REQUESTS_LIMIT)),
+            vol.Required(OPTION_REQUEST_TIMEOUT, default=options[OPTION_REQUEST_TIMEOUT]):
+                vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+            vol.Required(OPTION_TEMPERATURE_DEADBAND, default=options[OPTION_TEMPERATURE_DEADBAND]):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+            vol.Required(OPTION_HUMIDITY_DEADBAND, default=options[OPTION_HUMIDITY_DEADBAND]):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+        }
+    )
+
 # Asynchronously validate the user input to ensure it allows for a successful connection.
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -59,6 +106,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             if data.get("pumps_regs_mapping", "") != "" else []:
         if not pr.isdecimal() or int(pr) < 1 or int(pr) > 5:
             raise InvalidPumpIndex
+    # Validate a serial port is given when talking Modbus RTU.
+    if data.get("transport") == TRANSPORT_MODBUS_RTU and not data.get("modbus_serial_port"):
+        raise MissingSerialPort
+    # Validate a Unix socket path given as address points to an existing socket.
+    if data.get("transport", TRANSPORT_HTTP) == TRANSPORT_HTTP and \
+            hub.is_unix_socket_address(data["neasmart_gw_server_host"]) and \
+            not await hass.async_add_executor_job(_is_unix_socket, data["neasmart_gw_server_host"]):
+        raise InvalidSocketPath
 
     # Create an instance of the Rehau Neasmart 2.0 Climate Control System hub.
     neasmart_climate_control_hub = hub.RehauNeasmart2ClimateControlSystem(
@@ -68,28 +123,61 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         data["neasmart_gw_server_port"],
         data["zones"],
         data.get("mixed_groups", 0),
+        data.get("pumps_regs_mapping", ""),
         data.get("dehumidificators_regs_mapping", ""),
-        data.get("pumps_regs_mapping", "")
+        transport=data.get("transport", TRANSPORT_HTTP),
+        modbus_serial_port=data.get("modbus_serial_port"),
+        modbus_baudrate=data.get("modbus_baudrate", MODBUS_DEFAULT_BAUDRATE),
+        modbus_slave_id=data.get("modbus_slave_id", MODBUS_DEFAULT_SLAVE_ID)
     )
 
-    # Test the connection to the hub.
-    if not await neasmart_climate_control_hub.test_connection():
-        raise CannotConnect
+    # Test the connection to the hub, then probe every configured endpoint so a wrong topology is caught now.
+    # Both steps share a single deadline: the probe gets the time left by the health check.
+    deadline = time.monotonic() + VALIDATION_DEADLINE
+    neasmart_climate_control_hub.transport.set_timeout(VALIDATION_DEADLINE)
+    try:
+        if not await neasmart_climate_control_hub.test_connection():
+            raise CannotConnect
+        latencies = await neasmart_climate_control_hub.async_probe_endpoints(deadline - time.monotonic())
+    finally:
+        await hass.async_add_executor_job(neasmart_climate_control_hub.transport.close)
+    for endpoint, latency in latencies.items():
+        if latency is not None:
+            _LOGGER.debug("%s answered in %.3f s", endpoint, latency)
+    unreachable = [endpoint for endpoint, latency in latencies.items() if latency is None]
+    if unreachable:
+        raise UnreachableEndpoints(", ".join(unreachable))
 
     return {"title": f"{data['climate_system_name']} Climate Control System"}
 
+# Check whether a path is an existing Unix domain socket.
+def _is_unix_socket(path: str) -> bool:
+    """Return True when path exists and is a Unix domain socket."""
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
 # Define the configuration flow for the Rehau Neasmart 2.0 integration.
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Rehau Neasmart 2.0."""
 
     VERSION = 1
 
+    # Provide the options flow tuning the running hub.
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return OptionsFlow()
+
     # Handle the initial step of the configuration flow.
     async def async_step_user(
             self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
+        placeholders: dict[str, str] = {}
         if user_input is not None:
             try:
                 # Validate the user input.
@@ -108,6 +196,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "too_many_extra_pump"
             except InvalidPumpIndex:
                 errors["base"] = "invalid_pump_index"
+            except MissingSerialPort:
+                errors["base"] = "missing_serial_port"
+            except InvalidSocketPath:
+                errors["base"] = "invalid_socket_path"
+            except hub.ModbusUnavailable:
+                errors["base"] = "modbus_unavailable"
+            except UnreachableEndpoints as err:
+                errors["base"] = "unreachable_endpoints"
+                placeholders["endpoints"] = str(err)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -117,7 +214,24 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Show the form to the user with any validation errors.
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors,
+            description_placeholders=placeholders
+        )
+
+# Define the options flow, applied to the running hub without reloading the entry.
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of Rehau Neasmart 2.0."""
+
+    # Handle the single step of the options flow.
+    async def async_step_init(
+            self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the poll intervals, concurrency, timeout and deadbands options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema(dict(self.config_entry.options))
         )
 
 # Define custom exceptions for various validation errors.
@@ -140,4 +254,13 @@ class TooManyExtraPumps(HomeAssistantError):
     """Error to indicate there are too many pumps."""
 
 class InvalidPumpIndex(HomeAssistantError):
-    """Error to indicate there are too many pumps."""
\ No newline at end of file
+    """Error to indicate there are too many pumps."""
+
+class MissingSerialPort(HomeAssistantError):
+    """Error to indicate the serial port is missing for Modbus RTU."""
+
+class InvalidSocketPath(HomeAssistantError):
+    """Error to indicate the Unix socket path is not an existing socket."""
+
+class UnreachableEndpoints(HomeAssistantError):
+    """Error to indicate some configured zones or devices do not answer."""
\ No newline at end of file
@@ -26,3 +26,103 @@ PRESET_CLIMATE_MODES_MAPPING = {
     "Forced Cooling": 5
 }
 PRESET_CLIMATE_MODES_MAPPING_REVERSE = {v: k for k, v in PRESET_CLIMATE_MODES_MAPPING.items()}
+# Maximum age (seconds) of the zones snapshot before a new batch refresh is triggered.
+ZONES_SNAPSHOT_MAX_AGE = 25
+# Maximum number of concurrent requests towards the shim server.
+MAX_CONCURRENT_REQUESTS = 4
+# Request priorities, lower values are served first.
+PRIORITY_WRITE = 0
+PRIORITY_ALERT = 5
+PRIORITY_POLL = 10
+# Timeout (seconds) of a single request towards the shim server.
+REQUEST_TIMEOUT = 10
+# Storage version of the write-behind queue.
+WRITE_QUEUE_STORAGE_VERSION = 1
+# Storage key of the write-behind queue, formatted with the config entry id.
+WRITE_QUEUE_STORAGE_KEY = DOMAIN + ".{}.write_queue"
+# Delay (seconds) used to batch the write-behind queue saves.
+WRITE_QUEUE_SAVE_DELAY = 1
+# Interval (seconds) between two attempts to drain the write-behind queue while the shim server is down.
+WRITE_QUEUE_RETRY_INTERVAL = 30
+# Endpoints whose writes affect the effective state of every zone.
+GLOBAL_ENDPOINTS = ("state", "mode")
+# Delay (seconds) coalescing the zones invalidations into a single bulk refresh.
+ZONES_INVALIDATION_DELAY = 2
+# Number of zones read together during a bulk refresh, and pause (seconds) between two batches.
+ZONES_REFRESH_BATCH_SIZE = 12
+ZONES_REFRESH_BATCH_INTERVAL = 0.5
+# Dispatcher signal sent, formatted with the hub id, whenever a zones batch refresh finds changed zones data.
+SIGNAL_ZONES_REFRESHED = DOMAIN + "_zones_refreshed_{}"
+# Dispatcher signal sent, formatted with the hub id, once the zones have been re-read after a global change.
+SIGNAL_GLOBAL_REFRESHED = DOMAIN + "_global_refreshed_{}"
+# Transports towards the Sysbus: REST shim add-on, or direct Modbus over a serial port or a TCP bridge.
+TRANSPORT_HTTP = "http"
+TRANSPORT_MODBUS_RTU = "modbus_rtu"
+TRANSPORT_MODBUS_TCP = "modbus_tcp"
+TRANSPORTS = [TRANSPORT_HTTP, TRANSPORT_MODBUS_RTU, TRANSPORT_MODBUS_TCP]
+MODBUS_DEFAULT_BAUDRATE = 38400
+MODBUS_DEFAULT_SLAVE_ID = 1
+# Modbus maximum registers per read.
+MODBUS_MAX_BLOCK_SIZE = 125
+# Maximum age (seconds) of the Modbus registers snapshot served to the endpoints reads.
+MODBUS_SNAPSHOT_MAX_AGE = 5
+# Base URL of the requests sent to a shim server listening on a Unix domain socket.
+UNIX_SOCKET_BASE_URL = "http+unix://neasmart-gateway"
+# Interval (seconds) of the zones polls while the gateway refresh cadence is being learned.
+CADENCE_PROBE_INTERVAL = 5
+# Delay (seconds) after the expected gateway refresh at which the zones are polled.
+CADENCE_POLL_OFFSET = 2
+# Observed gateway refreshes kept, and minimum number of their intervals, to estimate the cadence.
+CADENCE_HISTORY = 16
+CADENCE_MIN_SAMPLES = 4
+# Shortest gateway refresh period (seconds) considered.
+CADENCE_MIN_PERIOD = 10
+# Consecutive refresh periods without changes after which the cadence is learned again.
+CADENCE_MAX_MISSES = 3
+# Longest learning (seconds) of the gateway cadence, the zones are then polled at the zones poll interval.
+CADENCE_LEARNING_TIMEOUT = 600
+# Delay (seconds) before learning again a gateway cadence that could not be learned.
+CADENCE_RELEARN_DELAY = 21600
+# Consecutive failed requests after which the shim server is considered unreachable.
+OUTAGE_FAILURE_THRESHOLD = 3
+# Interval (seconds) between the summaries logged while the shim server is unreachable.
+ERROR_SUMMARY_INTERVAL = 300
+# Duration (seconds) of an outage after which a repair issue is raised.
+OUTAGE_ISSUE_DELAY = 600
+# Minimum interval (seconds) between two errors logged by the same entity.
+ENTITY_ERROR_LOG_INTERVAL = 900
+# Options tunable from the options flow, applied to the running hub without reloading the entry.
+OPTION_ZONES_POLL_INTERVAL = "zones_poll_interval"
+OPTION_CADENCE_PROBE_INTERVAL = "cadence_probe_interval"
+OPTION_WRITE_RETRY_INTERVAL = "write_retry_interval"
+OPTION_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+OPTION_REQUEST_TIMEOUT = "request_timeout"
+OPTION_TEMPERATURE_DEADBAND = "temperature_deadband"
+OPTION_HUMIDITY_DEADBAND = "humidity_deadband"
+# Default value of each option.
+DEFAULT_OPTIONS = {
+    OPTION_ZONES_POLL_INTERVAL: ZONES_SNAPSHOT_MAX_AGE,
+    OPTION_CADENCE_PROBE_INTERVAL: CADENCE_PROBE_INTERVAL,
+    OPTION_WRITE_RETRY_INTERVAL: WRITE_QUEUE_RETRY_INTERVAL,
+    OPTION_MAX_CONCURRENT_REQUESTS: MAX_CONCURRENT_REQUESTS,
+    OPTION_REQUEST_TIMEOUT: REQUEST_TIMEOUT,
+    OPTION_TEMPERATURE_DEADBAND: 0.0,
+    OPTION_HUMIDITY_DEADBAND: 0.0,
+}
+# Largest number of concurrent requests accepted from the options flow.
+MAX_CONCURRENT_REQUESTS_LIMIT = 10
+# Endpoints carrying alerts, polled at full rate and priority even when shedding load.
+CRITICAL_ENDPOINTS = ("notifications",)
+# Interval (seconds) between two measures of the event loop lag and executor queue depth.
+LOAD_PROBE_INTERVAL = 2
+# Weight of the last measure in the smoothed event loop lag.
+LOOP_LAG_SMOOTHING = 0.3
+# Event loop lag (seconds) and executor queued jobs above which the polling sheds load.
+LOOP_LAG_THRESHOLD = 0.1
+EXECUTOR_QUEUE_THRESHOLD = 16
+# Factor stretching the non-critical poll intervals while shedding load.
+LOAD_SHED_STRETCH = 3
+# Maximum age (seconds) of the non-critical payloads reused instead of polled while shedding load.
+LOAD_SHED_PAYLOAD_MAX_AGE = 90
+# Overall deadline (seconds) of the health check and configured endpoints probe run by the config flow.
+VALIDATION_DEADLINE = 2
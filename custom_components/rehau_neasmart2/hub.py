@@ -1,19 +1,615 @@
 """A demonstration 'hub' that connects several devices."""
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections import OrderedDict, deque
+from functools import partial
+import heapq
+import itertools
+import math
+import socket
+import threading
+import time
+from typing import Any, Callable, Mapping
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.storage import Store
 from .const import (
-    BINARY_STATUSES
+    BINARY_STATUSES,
+    CADENCE_HISTORY,
+    CADENCE_LEARNING_TIMEOUT,
+    CADENCE_MAX_MISSES,
+    CADENCE_MIN_PERIOD,
+    CADENCE_MIN_SAMPLES,
+    CADENCE_POLL_OFFSET,
+    CADENCE_RELEARN_DELAY,
+    CRITICAL_ENDPOINTS,
+    DEFAULT_OPTIONS,
+    DOMAIN,
+    ENTITY_ERROR_LOG_INTERVAL,
+    ERROR_SUMMARY_INTERVAL,
+    EXECUTOR_QUEUE_THRESHOLD,
+    GLOBAL_ENDPOINTS,
+    LOAD_PROBE_INTERVAL,
+    LOAD_SHED_PAYLOAD_MAX_AGE,
+    LOAD_SHED_STRETCH,
+    LOOP_LAG_SMOOTHING,
+    LOOP_LAG_THRESHOLD,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_REQUESTS_LIMIT,
+    MODBUS_DEFAULT_BAUDRATE,
+    MODBUS_DEFAULT_SLAVE_ID,
+    OPTION_CADENCE_PROBE_INTERVAL,
+    OPTION_HUMIDITY_DEADBAND,
+    OPTION_MAX_CONCURRENT_REQUESTS,
+    OPTION_REQUEST_TIMEOUT,
+    OPTION_TEMPERATURE_DEADBAND,
+    OPTION_WRITE_RETRY_INTERVAL,
+    OPTION_ZONES_POLL_INTERVAL,
+    OUTAGE_FAILURE_THRESHOLD,
+    OUTAGE_ISSUE_DELAY,
+    PRIORITY_ALERT,
+    PRIORITY_POLL,
+    PRIORITY_WRITE,
+    REQUEST_TIMEOUT,
+    SIGNAL_GLOBAL_REFRESHED,
+    SIGNAL_ZONES_REFRESHED,
+    TRANSPORT_HTTP,
+    UNIX_SOCKET_BASE_URL,
+    WRITE_QUEUE_SAVE_DELAY,
+    WRITE_QUEUE_STORAGE_KEY,
+    WRITE_QUEUE_STORAGE_VERSION,
+    ZONES_INVALIDATION_DELAY,
+    ZONES_REFRESH_BATCH_INTERVAL,
+    ZONES_REFRESH_BATCH_SIZE
 )
 import logging
 
+# Compact wire formats are requirements of the integration, JSON is still used if their decoders are missing.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
 # Initialize a logger for this module.
 _LOGGER = logging.getLogger(__name__)
 
+# Define the error raised by the transports when the Sysbus cannot be reached.
+class GatewayUnreachable(HomeAssistantError):
+    """Error to indicate the shim server or the Sysbus interface did not answer, or failed on its side."""
+
+# Define the error raised when a Modbus transport is configured without pymodbus installed.
+class ModbusUnavailable(HomeAssistantError):
+    """Error to indicate a Modbus transport is configured but the pymodbus package is not installed."""
+
+# Class prioritizing the requests sent to the shim server.
+class RehauNeasmart2RequestScheduler:
+    """Priority gate bounding the concurrent requests towards the shim server.
+
+    Requests waiting for a free slot are served lowest priority value first, FIFO
+    within the same priority, so user-initiated writes overtake queued background polls.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int) -> None:
+        """Initialize the scheduler with the maximum number of in-flight requests."""
+        self.hass = hass  # Home Assistant instance.
+        self.max_concurrent = max_concurrent  # Maximum number of in-flight requests.
+        self._active = 0  # Number of in-flight requests.
+        self._waiters = []  # Heap of (priority, sequence, future) waiting for a slot.
+        self._sequence = itertools.count()  # Tie breaker keeping the same priority requests FIFO.
+
+    # Asynchronously run a blocking I/O function in the executor once a slot is granted.
+    async def async_run(self, priority: int, func, *args) -> Any:
+        """Run func(*args) in the executor as soon as a slot is available for the given priority."""
+        await self._acquire(priority)
+        try:
+            return await self.hass.async_add_executor_job(func, *args)
+        finally:
+            self._release()
+
+    def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Change the maximum number of in-flight requests, granting the new slots right away."""
+        self.max_concurrent = max_concurrent
+        while self._active < self.max_concurrent and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._active += 1
+                future.set_result(None)
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for a free slot, queuing behind the requests with a lower or equal priority value."""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            return
+        future = self.hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot was already handed over to us, pass it on.
+            if not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot over to the most urgent waiter, or free it.
+
+        The slot is freed when the maximum was lowered below the in-flight requests, so a
+        smaller maximum applies while requests are queued.
+        """
+        if self._active > self.max_concurrent:
+            self._active -= 1
+            return
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+# Class reaching the Sysbus through the REST shim add-on.
+class RehauNeasmart2HttpTransport:
+    """HTTP transport towards the REST shim server, keeping its connections alive.
+
+    The shim server is reached over TCP, or over a Unix domain socket when the add-on
+    runs on the same host as Home Assistant.
+    """
+
+    def __init__(self, base_url: str, socket_path: str | None = None) -> None:
+        """Initialize the transport with the base URL, or the Unix socket path, of the shim server."""
+        self.address = socket_path or base_url  # Address of the shim server, used in logs.
+        self._base_url = UNIX_SOCKET_BASE_URL if socket_path else base_url  # Base URL of the requests.
+        self.timeout = REQUEST_TIMEOUT  # Timeout (seconds) of each request.
+        self._session = requests.Session()  # Session reusing the connections to the shim server.
+        self._etags = {}  # ETag of the last response of each endpoint, sent back as If-None-Match.
+        self._payloads = {}  # Last decoded payload of each endpoint.
+        self._decoders = _wire_decoders()  # Decoders of the compact wire formats offered to the shim server.
+        self._session.headers["Accept"] = _accept_header(self._decoders)
+        if socket_path:
+            self._session.mount(UNIX_SOCKET_BASE_URL, _UnixSocketAdapter(socket_path))
+        else:
+            # Keep as many connections as requests may run at once, so none is opened and discarded per request.
+            self._session.mount("http://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS_LIMIT))
+
+    def check_online(self) -> bool:
+        """Check the shim server answers its health check.
+
+        Raises GatewayUnreachable when the shim server does not answer or fails on its side (5xx).
+        """
+        try:
+            r = self._session.get(f"{self._base_url}/health", timeout=self.timeout)
+        except requests.RequestException as e:
+            raise GatewayUnreachable(f"Error calling {self.address}/health: {e}") from e
+        if r.status_code >= 500:
+            raise GatewayUnreachable(f"Error calling {self.address}/health, code {r.status_code}")
+        return r.status_code == 200
+
+    def get(self, endpoint: str) -> tuple[dict | None, bool]:
+        """Retrieve the JSON payload of an endpoint, and whether its content changed since the last retrieval.
+
+        The ETag of each endpoint is sent back as If-None-Match, a 304 answer reuses the
+        previously decoded payload without downloading nor parsing it again. A full answer is
+        compared to the previous payload, as the shim server may send no ETag at all. Raises
+        GatewayUnreachable when the shim server does not answer or fails on its side (5xx),
+        the payload is None when it rejects the request.
+        """
+        previous = self._payloads.get(endpoint)
+        etag = self._etags.get(endpoint) if previous is not None else None
+        headers = {"If-None-Match": etag} if etag is not None else None
+        try:
+            r = self._session.get(f"{self._base_url}/{endpoint}", headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise GatewayUnreachable(f"Error calling {self.address}/{endpoint}: {e}") from e
+        if r.status_code >= 500:
+            raise GatewayUnreachable(f"Error calling {self.address}/{endpoint}, code {r.status_code}")
+        if r.status_code == 304 and previous is not None:
+            return previous, False
+        if r.status_code != 200:
+            _LOGGER.debug("Error calling %s/%s, code %s", self.address, endpoint, r.status_code)
+            return None, False
+        payload = self._decode(r)
+        if payload is None:
+            return None, False
+        etag = r.headers.get("ETag")
+        if etag is not None:
+            self._etags[endpoint] = etag
+        else:
+            self._etags.pop(endpoint, None)
+        if payload == previous:
+            return previous, False
+        self._payloads[endpoint] = payload
+        return payload, True
+
+    def post(self, endpoint: str, payload: dict) -> bool:
+        """Send a JSON payload to an endpoint, returning whether the shim server accepted it.
+
+        Raises GatewayUnreachable when the shim server does not answer or fails on its side (5xx).
+        """
+        try:
+            r = self._session.post(f"{self._base_url}/{endpoint}", json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise GatewayUnreachable(f"Error sending {payload} to {self.address}/{endpoint}: {e}") from e
+        if r.status_code >= 500:
+            raise GatewayUnreachable(f"Error sending {payload} to {self.address}/{endpoint}, code {r.status_code}")
+        if r.status_code != 202:
+            _LOGGER.debug("Error sending %s to %s/%s, code %s", payload, self.address, endpoint, r.status_code)
+            return False
+        return True
+
+    def set_endpoints(self, endpoints: list[str]) -> None:
+        """Forget the ETags and payloads of the endpoints dropped from the poll plan."""
+        for endpoint in self._payloads.keys() - set(endpoints):
+            self._payloads.pop(endpoint, None)
+            self._etags.pop(endpoint, None)
+
+    def set_timeout(self, timeout: float) -> None:
+        """Change the timeout of the next requests."""
+        self.timeout = timeout
+
+    def close(self) -> None:
+        """Close the connections to the shim server."""
+        self._session.close()
+
+    def _decode(self, r: requests.Response) -> Any:
+        """Decode a response according to its content type, falling back to JSON for good on errors."""
+        content_type = r.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        decoder = self._decoders.get(content_type)
+        if decoder is None:
+            return r.json()
+        try:
+            return decoder(r.content)
+        except ValueError as e:
+            _LOGGER.warning("Error decoding %s from %s, falling back to JSON: %s", content_type, self.address, e)
+            self._decoders = {}
+            self._session.headers["Accept"] = _accept_header(self._decoders)
+            return None
+
+# Return the decoders of the installed compact wire formats, most preferred first.
+def _wire_decoders() -> dict[str, Callable[[bytes], Any]]:
+    """Return the content type -> decoder mapping of the compact wire formats available."""
+    decoders = {}
+    if msgpack is not None:
+        decoders["application/msgpack"] = partial(msgpack.unpackb, raw=False)
+        decoders["application/x-msgpack"] = decoders["application/msgpack"]
+    if cbor2 is not None:
+        decoders["application/cbor"] = cbor2.loads
+    return decoders
+
+# Build the Accept header preferring the compact wire formats over JSON.
+def _accept_header(decoders: dict[str, Callable[[bytes], Any]]) -> str:
+    """Return an Accept header listing the compact wire formats, by preference, then JSON."""
+    media_types = [
+        f"{content_type};q={1 - i / 10:.1f}" if i else content_type
+        for i, content_type in enumerate(decoders)
+    ]
+    media_types.append("application/json;q=0.5" if decoders else "application/json")
+    return ", ".join(media_types)
+
+# Check whether the shim server address is a Unix domain socket path.
+def is_unix_socket_address(host: str) -> bool:
+    """Return True when the shim server address is the path of a Unix domain socket."""
+    return host.startswith("/")
+
+class _UnixSocketConnection(HTTPConnection):
+    """HTTP connection opened over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, **kwargs) -> None:
+        super().__init__("localhost", **kwargs)
+        self._socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        return sock
+
+class _UnixSocketConnectionPool(HTTPConnectionPool):
+    """Connection pool of HTTP connections over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, maxsize: int) -> None:
+        super().__init__("localhost", maxsize=maxsize)
+        self._socket_path = socket_path
+
+    def _new_conn(self) -> _UnixSocketConnection:
+        return _UnixSocketConnection(self._socket_path, timeout=self.timeout.connect_timeout)
+
+class _UnixSocketAdapter(HTTPAdapter):
+    """Requests adapter sending every request to a Unix domain socket."""
+
+    def __init__(self, socket_path: str) -> None:
+        super().__init__()
+        self._pool = _UnixSocketConnectionPool(socket_path, MAX_CONCURRENT_REQUESTS_LIMIT)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def get_connection(self, url, proxies=None):
+        return self._pool
+
+    def close(self) -> None:
+        super().close()
+        self._pool.close()
+
+# Class learning the cadence at which the gateway refreshes the Sysbus data.
+class RehauNeasmart2CadenceEstimator:
+    """Estimator of the period and phase of the gateway Sysbus refreshes.
+
+    While learning, each poll observing a change means a gateway refresh happened since the
+    previous poll, and the middle of that window is kept as a sample. The period is the common
+    divisor of the samples intervals, as unchanged values hide some refreshes, and the phase is
+    the circular mean of the samples over that period. Once locked, the polls land just after
+    the expected refresh: the phase creeps earlier on every hit and, when a poll comes too
+    early, a retry follows shortly after and moves the phase later. Learning gives up after
+    CADENCE_LEARNING_TIMEOUT, and starts again CADENCE_RELEARN_DELAY later.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the estimator with no knowledge of the gateway cadence."""
+        self.period = None  # Estimated gateway refresh period (seconds), None until learned.
+        self._phase = None  # Estimated instant, modulo the period, of the gateway refreshes.
+        self._samples = deque(maxlen=CADENCE_HISTORY)  # Estimated instants of the observed refreshes.
+        self._last_poll = None  # Monotonic time of the previous poll.
+        self._retrying = False  # Whether the next poll retries an aligned poll observing no change.
+        self._misses = 0  # Consecutive refresh periods observing no change.
+        self._learning_until = None  # Monotonic time at which the ongoing learning gives up.
+        self._relearn_at = None  # Monotonic time at which learning starts again after giving up.
+
+    def learning(self, now: float) -> bool:
+        """Return whether the cadence is being learned, rather than known or given up on."""
+        return self.period is None and (self._relearn_at is None or now >= self._relearn_at)
+
+    def observe(self, poll_time: float, changed: bool) -> None:
+        """Record the outcome of a poll."""
+        if self.period is None:
+            if not self.learning(poll_time):
+                return
+            if self._learning_until is None:
+                # A new learning starts, the previous poll is too old to bound a refresh.
+                self._learning_until = poll_time + CADENCE_LEARNING_TIMEOUT
+                self._relearn_at = None
+                self._last_poll = None
+            if changed and self._last_poll is not None:
+                self._samples.append((self._last_poll + poll_time) / 2)
+                self._estimate()
+            if self.period is None and poll_time >= self._learning_until:
+                _LOGGER.debug("No gateway refresh cadence found in %d s, learning again in %d s",
+                              CADENCE_LEARNING_TIMEOUT, CADENCE_RELEARN_DELAY)
+                self._samples.clear()
+                self._learning_until = None
+                self._relearn_at = poll_time + CADENCE_RELEARN_DELAY
+        elif changed:
+            # A hit on a retry means the refresh came after the aligned poll.
+            shift = CADENCE_POLL_OFFSET if self._retrying else -CADENCE_POLL_OFFSET / 4
+            self._phase = (self._phase + shift) % self.period
+            self._retrying = False
+            self._misses = 0
+        elif not self._retrying:
+            self._retrying = True
+        else:
+            # Nothing changed during the whole period, the values may just be stable.
+            self._retrying = False
+            self._misses += 1
+            if self._misses >= CADENCE_MAX_MISSES:
+                self.reset()
+        self._last_poll = poll_time
+
+    def reset(self) -> None:
+        """Forget the learned cadence."""
+        self.period = None
+        self._phase = None
+        self._samples.clear()
+        self._retrying = False
+        self._misses = 0
+        self._learning_until = None
+        self._relearn_at = None
+
+    def next_poll_delay(self, now: float, skip: int = 0) -> float | None:
+        """Return the delay to poll just after the next expected refresh, None until the cadence is known.
+
+        Skipping some refreshes abandons a pending retry, the next poll stays aligned anyway.
+        """
+        if self.period is None:
+            return None
+        if self._retrying and not skip:
+            return CADENCE_POLL_OFFSET
+        self._retrying = False
+        return self.period * (skip + 1) - (now - self._phase - CADENCE_POLL_OFFSET) % self.period
+
+    def _estimate(self) -> None:
+        """Estimate period and phase from the samples."""
+        samples = list(self._samples)
+        intervals = [b - a for a, b in zip(samples, samples[1:]) if b - a >= CADENCE_MIN_PERIOD]
+        if len(intervals) < CADENCE_MIN_SAMPLES:
+            return
+        shortest = min(intervals)
+        period = sum(interval / round(interval / shortest) for interval in intervals) / len(intervals)
+        angles = [2 * math.pi * (sample % period) / period for sample in samples]
+        phase = math.atan2(sum(map(math.sin, angles)), sum(map(math.cos, angles)))
+        self.period = period
+        self._phase = (phase % (2 * math.pi)) * period / (2 * math.pi)
+        self._learning_until = None
+
+
+# Return the number of jobs waiting for a thread of the default executor.
+# Neither asyncio nor concurrent.futures expose it: this reads the _default_executor attribute of
+# the CPython event loop, set by Home Assistant to its own executor at startup, and the _work_queue
+# of the CPython ThreadPoolExecutor. Either may change with a Python or Home Assistant release.
+def _executor_queue_depth(hass: HomeAssistant) -> int | None:
+    """Return the depth of the default executor work queue, None when it cannot be inspected."""
+    work_queue = getattr(getattr(hass.loop, "_default_executor", None), "_work_queue", None)
+    if work_queue is None or not hasattr(work_queue, "qsize"):
+        return None
+    return work_queue.qsize()
+
+# Class measuring the load of Home Assistant to shed the non-critical polling.
+class RehauNeasmart2LoadMonitor:
+    """Monitor of the event loop lag and of the executor queue depth.
+
+    A callback scheduled every LOAD_PROBE_INTERVAL measures how late it runs. Load is shed
+    when the smoothed lag or the executor backlog exceed their threshold, and no longer once
+    both fall under half of it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor, assuming no load."""
+        self.hass = hass  # Home Assistant instance.
+        self.loop_lag = 0.0  # Smoothed event loop lag (seconds).
+        self.executor_queue = 0  # Jobs waiting for an executor thread at the last probe.
+        self.shedding = False  # Whether the non-critical polling is being stretched.
+        self._handle = None  # Next probe, if scheduled.
+        self._expected = None  # Loop time at which the next probe should run.
+        self._queue_unknown = False  # Whether the executor queue could not be inspected.
+
+    @property
+    def stretch(self) -> int:
+        """Return the factor to apply to the non-critical poll intervals."""
+        return LOAD_SHED_STRETCH if self.shedding else 1
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing the load."""
+        self._schedule_probe()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing the load."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def _schedule_probe(self) -> None:
+        """Schedule the next probe."""
+        self._expected = self.hass.loop.time() + LOAD_PROBE_INTERVAL
+        self._handle = self.hass.loop.call_at(self._expected, self._probe)
+
+    @callback
+    def _probe(self) -> None:
+        """Measure how late the probe runs and the executor backlog, updating the shedding state."""
+        lag = max(0.0, self.hass.loop.time() - self._expected)
+        self.loop_lag += LOOP_LAG_SMOOTHING * (lag - self.loop_lag)
+        depth = _executor_queue_depth(self.hass)
+        if depth is None and not self._queue_unknown:
+            _LOGGER.debug("Executor work queue cannot be inspected, shedding load on the event loop lag only")
+        self._queue_unknown = depth is None
+        self.executor_queue = depth or 0
+        if not self.shedding and \
+                (self.loop_lag > LOOP_LAG_THRESHOLD or self.executor_queue > EXECUTOR_QUEUE_THRESHOLD):
+            self.shedding = True
+            _LOGGER.info("Event loop lag %.3f s, %d executor jobs queued: stretching the non-critical polling",
+                         self.loop_lag, self.executor_queue)
+        elif self.shedding and self.loop_lag < LOOP_LAG_THRESHOLD / 2 and \
+                self.executor_queue < EXECUTOR_QUEUE_THRESHOLD / 2:
+            self.shedding = False
+            _LOGGER.info("Event loop lag %.3f s, %d executor jobs queued: polling at full rate again",
+                         self.loop_lag, self.executor_queue)
+        self._schedule_probe()
+
+# Class aggregating the shim server failures into one report per outage.
+class RehauNeasmart2ErrorReporter:
+    """Reporter of the shim server outages.
+
+    OUTAGE_FAILURE_THRESHOLD consecutive unanswered requests (connection errors, timeouts or
+    server side errors) open an outage window, so rejected requests and a single misbehaving
+    endpoint do not look like an outage: the hub goes offline, a single line is logged, and a
+    summary follows every ERROR_SUMMARY_INTERVAL while it lasts. An outage lasting
+    OUTAGE_ISSUE_DELAY raises a repair issue, removed as soon as a request is answered.
+    Entity errors are silenced during outages and throttled per entity otherwise.
+    """
+
+    def __init__(self, hass: HomeAssistant, hub: RehauNeasmart2ClimateControlSystem) -> None:
+        """Initialize the reporter of the hub."""
+        self.hass = hass  # Home Assistant instance.
+        self.hub = hub  # Reference to the associated hub.
+        self.issue_id = f"gateway_unreachable_{hub.id}"  # Repair issue raised on long outages.
+        self._lock = threading.Lock()  # Requests are recorded from the executor threads.
+        self._consecutive_failures = 0  # Failed requests since the last successful one.
+        self._outage_start = None  # Monotonic time at which the ongoing outage was detected.
+        self._failures = 0  # Failed requests during the ongoing outage.
+        self._last_summary = None  # Monotonic time of the last outage log line.
+        self._issue_raised = False  # Whether the repair issue of the ongoing outage was raised.
+        self._entity_log_times = {}  # Monotonic time of the last error logged for each entity.
+
+    @property
+    def outage(self) -> bool:
+        """Return whether the shim server is currently unreachable."""
+        return self._outage_start is not None
+
+    def record(self, success: bool, endpoint: str) -> None:
+        """Record the outcome of a request towards the shim server, from any thread."""
+        now = time.monotonic()
+        with self._lock:
+            if success:
+                self._consecutive_failures = 0
+                if self._outage_start is None:
+                    return
+                _LOGGER.warning("%s is reachable again after %d s, %d requests failed during the outage",
+                                self.hub.transport.address, now - self._outage_start, self._failures)
+                self._outage_start = None
+                self.hub.online = True
+                raise_issue, clear_issue = False, self._issue_raised
+                self._issue_raised = False
+            else:
+                self._consecutive_failures += 1
+                self._failures += 1
+                if self._outage_start is None:
+                    if self._consecutive_failures < OUTAGE_FAILURE_THRESHOLD:
+                        return
+                    _LOGGER.error("Cannot reach %s (%s failed), further errors are suppressed until it recovers",
+                                  self.hub.transport.address, endpoint)
+                    self._outage_start = self._last_summary = now
+                    self._failures = self._consecutive_failures
+                    self.hub.online = False
+                elif now - self._last_summary >= ERROR_SUMMARY_INTERVAL:
+                    _LOGGER.error("%s still unreachable after %d s, %d requests failed",
+                                  self.hub.transport.address, now - self._outage_start, self._failures)
+                    self._last_summary = now
+                raise_issue = not self._issue_raised and now - self._outage_start >= OUTAGE_ISSUE_DELAY
+                self._issue_raised = self._issue_raised or raise_issue
+                clear_issue = False
+        if raise_issue:
+            self.hass.loop.call_soon_threadsafe(self._async_raise_issue)
+        elif clear_issue:
+            self.hass.loop.call_soon_threadsafe(ir.async_delete_issue, self.hass, DOMAIN, self.issue_id)
+
+    def log(self, logger: logging.Logger, key: str, msg: str, *args: Any, level: int = logging.ERROR) -> None:
+        """Log an entity error, unless an outage is ongoing or the entity logged one recently."""
+        if self._outage_start is not None:
+            return
+        now = time.monotonic()
+        last = self._entity_log_times.get(key)
+        if last is not None and now - last < ENTITY_ERROR_LOG_INTERVAL:
+            return
+        self._entity_log_times[key] = now
+        logger.log(level, msg, *args)
+
+    @callback
+    def _async_raise_issue(self) -> None:
+        """Raise the repair issue of the ongoing outage."""
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            self.issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.ERROR,
+            translation_key="gateway_unreachable",
+            translation_placeholders={"name": self.hub.name, "address": self.hub.transport.address},
+        )
+
 # Class representing the Rehau Neasmart 2.0 Climate Control System hub.
 class RehauNeasmart2ClimateControlSystem:
     def __init__(self,
@@ -24,12 +620,17 @@ class RehauNeasmart2ClimateControlSystem:
                  zones: str,
                  mixg: int,
                  pumps: str,
-                 dehumidifiers: str) -> None:
+                 dehumidifiers: str,
+                 transport: str = TRANSPORT_HTTP,
+                 modbus_serial_port: str | None = None,
+                 modbus_baudrate: int = MODBUS_DEFAULT_BAUDRATE,
+                 modbus_slave_id: int = MODBUS_DEFAULT_SLAVE_ID) -> None:
         """Initialize the Rehau Neasmart 2.0 Climate Control System hub."""
         self.hass = hass  # Home Assistant instance.
         self.shim_host = shim_host  # Host address of the shim server.
         self.shim_port = shim_port  # Port number of the shim server.
         self.shim_base_url = f"http://{self.shim_host}:{self.shim_port}"  # Base URL for the shim server.
+        self.shim_socket_path = shim_host if is_unix_socket_address(shim_host) else None  # Unix socket of the shim.
         self.name = "{} Climate Control System".format(sysname)  # Name of the climate control system.
         self.model = "Neasmart 2.0 Base Station"  # Model of the base station.
         self.manufacturer = "Rehau"  # Manufacturer of the base station.
@@ -40,6 +641,28 @@ class RehauNeasmart2ClimateControlSystem:
         self.zones = []  # List to store zones.
         self.pumps = []  # List to store pumps.
         self.dehumidifiers = []  # List to store dehumidifiers.
+        self.aggregates = {}  # Building-wide aggregates computed from the zones snapshot.
+        self._zones_snapshot_time = None  # Monotonic time of the last zones batch refresh.
+        self._zones_refresh_lock = asyncio.Lock()  # Serializes the zones batch refreshes.
+        self._zones_invalidation_unsub = None  # Cancels the pending bulk refresh after an invalidation.
+        self.scheduler = RehauNeasmart2RequestScheduler(hass, MAX_CONCURRENT_REQUESTS)  # Prioritized shim I/O.
+        self.write_queue = None  # Persistent write-behind queue, created by async_setup.
+        self._consumers = {}  # Number of enabled entities consuming each endpoint.
+        self.cadence = RehauNeasmart2CadenceEstimator()  # Learns when the gateway refreshes the Sysbus data.
+        self._cadence_unsub = None  # Cancels the next zones poll aligned to the gateway cadence.
+        self._cadence_version = None  # Whether learning, and sum of the polled zones versions, at the last poll.
+        self.errors = RehauNeasmart2ErrorReporter(hass, self)  # Aggregates the failures into outage reports.
+        self.load = RehauNeasmart2LoadMonitor(hass)  # Decides when the non-critical polling sheds load.
+        self._payloads = {}  # Monotonic time and payload of the last successful read of each endpoint.
+        self._aggregates_stale = False  # Whether the aggregation was deferred while shedding load.
+        # Zones data max age and polls interval without a gateway cadence, and zones probes interval while learning it.
+        self.zones_poll_interval = DEFAULT_OPTIONS[OPTION_ZONES_POLL_INTERVAL]
+        self.cadence_probe_interval = DEFAULT_OPTIONS[OPTION_CADENCE_PROBE_INTERVAL]
+        self.write_retry_interval = DEFAULT_OPTIONS[OPTION_WRITE_RETRY_INTERVAL]  # Write queue drain retries.
+        self.deadbands = {
+            "temperature": DEFAULT_OPTIONS[OPTION_TEMPERATURE_DEADBAND],
+            "humidity": DEFAULT_OPTIONS[OPTION_HUMIDITY_DEADBAND],
+        }  # Smallest change of each measure propagated to the entities states.
 
         # Parse the topology of dehumidifiers, pumps, and zones.
         dehumidifiers_topology = dehumidifiers.split(",") if dehumidifiers != "" else []
@@ -54,143 +677,511 @@ class RehauNeasmart2ClimateControlSystem:
         self.zones = [RehauNeasmart2Zone((z // 12) + 1, z - (12 * (z // 12)) + 1, zones_name_array[z], self)
                       for z in range(0, len(zones_name_array))]
 
+        # Initialize the transport towards the Sysbus, the Modbus one is imported only when used.
+        if transport == TRANSPORT_HTTP:
+            self.transport = RehauNeasmart2HttpTransport(self.shim_base_url, self.shim_socket_path)
+        else:
+            try:
+                from .modbus import RehauNeasmart2ModbusTransport
+            except ImportError as e:
+                raise ModbusUnavailable(f"The {transport} transport needs pymodbus: {e}") from e
+            self.transport = RehauNeasmart2ModbusTransport(
+                transport, shim_host, shim_port, modbus_serial_port, modbus_baudrate, modbus_slave_id,
+                self.endpoints
+            )
+
+    @property
+    def endpoints(self) -> list[str]:
+        """Return the endpoints serving the configured topology."""
+        return ["mode", "state", "outsidetemperature", "notifications"] + \
+            [device.endpoint for device in self.mixgs + self.pumps + self.dehumidifiers + self.zones]
+
+    @property
+    def polled_endpoints(self) -> list[str]:
+        """Return the endpoints consumed by at least one enabled entity."""
+        return [endpoint for endpoint in self.endpoints if endpoint in self._consumers]
+
+    # Register the entities consuming some endpoints, so only those are polled.
+    @callback
+    def async_add_consumer(self, endpoints: list[str]) -> Callable[[], None]:
+        """Add a consumer of the endpoints to the poll plan, returning the callback removing it."""
+        for endpoint in endpoints:
+            self._consumers[endpoint] = self._consumers.get(endpoint, 0) + 1
+        self.transport.set_endpoints(self.polled_endpoints)
+
+        @callback
+        def remove_consumer() -> None:
+            """Remove the consumer, dropping the endpoints nobody else consumes from the poll plan."""
+            for endpoint in endpoints:
+                self._consumers[endpoint] -= 1
+                if not self._consumers[endpoint]:
+                    del self._consumers[endpoint]
+            self.transport.set_endpoints(self.polled_endpoints)
+
+        return remove_consumer
+
     @property
     def id(self) -> str:
         """Return the unique identifier of the hub."""
         return self._id
 
+    # Apply the options of the config entry to the running hub.
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply the poll intervals, concurrency, timeout and deadbands options, falling back to defaults."""
+        options = {**DEFAULT_OPTIONS, **options}
+        self.zones_poll_interval = options[OPTION_ZONES_POLL_INTERVAL]
+        self.cadence_probe_interval = options[OPTION_CADENCE_PROBE_INTERVAL]
+        self.write_retry_interval = options[OPTION_WRITE_RETRY_INTERVAL]
+        self.deadbands["temperature"] = options[OPTION_TEMPERATURE_DEADBAND]
+        self.deadbands["humidity"] = options[OPTION_HUMIDITY_DEADBAND]
+        self.scheduler.set_max_concurrent(options[OPTION_MAX_CONCURRENT_REQUESTS])
+        self.transport.set_timeout(options[OPTION_REQUEST_TIMEOUT])
+
+    # Asynchronously set up the hub runtime resources for a config entry.
+    async def async_setup(self, entry_id: str) -> None:
+        """Restore the write-behind queue of the config entry."""
+        self.write_queue = RehauNeasmart2WriteBehindQueue(
+            self.hass, self, WRITE_QUEUE_STORAGE_KEY.format(entry_id)
+        )
+        await self.write_queue.async_load()
+        self.load.async_start()
+        self._cadence_unsub = async_call_later(self.hass, self.cadence_probe_interval, self._async_cadence_poll)
+
+    # Asynchronously release the hub runtime resources.
+    async def async_shutdown(self) -> None:
+        """Stop the background work of the hub and persist the pending writes."""
+        self.load.async_stop()
+        if self._cadence_unsub is not None:
+            self._cadence_unsub()
+            self._cadence_unsub = None
+        if self._zones_invalidation_unsub is not None:
+            self._zones_invalidation_unsub()
+            self._zones_invalidation_unsub = None
+        if self.write_queue is not None:
+            await self.write_queue.async_shutdown()
+        await self.hass.async_add_executor_job(self.transport.close)
+        ir.async_delete_issue(self.hass, DOMAIN, self.errors.issue_id)
+
     # Asynchronously test the connection to the shim server.
     async def test_connection(self) -> bool:
         """Test the connection to the shim server."""
-        return await self.hass.async_add_executor_job(self._check_shim_online)
+        return await self.scheduler.async_run(PRIORITY_POLL, self._check_shim_online)
+
+    # Asynchronously probe every configured endpoint at once, within a deadline.
+    async def async_probe_endpoints(self, deadline: float) -> dict[str, float | None]:
+        """Read all the configured endpoints concurrently, returning the latency of each one.
+
+        At most MAX_CONCURRENT_REQUESTS_LIMIT requests run at once, the size of the connection
+        pool. The latency is None for the endpoints that failed or did not answer before the deadline,
+        all of them when the deadline is already spent.
+        """
+        if deadline <= 0:
+            return dict.fromkeys(self.endpoints)
+        self.transport.set_timeout(deadline)
+        slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_LIMIT)
+
+        async def probe(endpoint: str) -> float | None:
+            async with slots:
+                start = time.monotonic()
+                payload, _ = await self.hass.async_add_executor_job(self.transport.get, endpoint)
+            return None if payload is None else time.monotonic() - start
+
+        tasks = {endpoint: asyncio.ensure_future(probe(endpoint)) for endpoint in self.endpoints}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+        return {
+            endpoint: task.result() if task in done and task.exception() is None else None
+            for endpoint, task in tasks.items()
+        }
 
     # Check if the shim server is online.
     def _check_shim_online(self) -> bool:
         """Check if the shim server is online by sending a health check request."""
-        r = requests.get(f"{self.shim_base_url}/health")
-        return r.status_code == 200
+        try:
+            online = self.transport.check_online()
+        except GatewayUnreachable as e:
+            _LOGGER.debug("%s", e)
+            self.errors.record(False, "health")
+            return False
+        self.errors.record(True, "health")
+        return online
+
+    # Asynchronously get a field of an endpoint, reusing the last payload of the non-critical ones under load.
+    async def async_get_data(self, endpoint: str, key: str) -> Any:
+        """Retrieve a field of an endpoint, stretching the non-critical polls while shedding load.
+
+        A value still queued for the field is returned as is, so the entity does not bounce back to
+        the old value until the write is drained.
+        """
+        if self.write_queue is not None:
+            queued = self.write_queue.queued(endpoint).get(key)
+            if queued is not None:
+                return queued
+        if endpoint in CRITICAL_ENDPOINTS:
+            return await self.scheduler.async_run(PRIORITY_ALERT, self.data_getter_helper, endpoint, key, None)
+        if self.load.shedding:
+            cached = self._payloads.get(endpoint)
+            if cached is not None and time.monotonic() - cached[0] < LOAD_SHED_PAYLOAD_MAX_AGE:
+                return cached[1].get(key)
+        return await self.scheduler.async_run(PRIORITY_POLL, self.data_getter_helper, endpoint, key, None)
+
+    # Get a field of an endpoint from the last payload read, without polling.
+    def cached_data(self, endpoint: str, key: str) -> Any:
+        """Return a field of the last payload read from an endpoint, None if it was never read."""
+        cached = self._payloads.get(endpoint)
+        return cached[1].get(key) if cached is not None else None
 
     # Asynchronously get the outside temperature.
     async def get_outside_temperature(self) -> float | None:
         """Retrieve the outside temperature."""
-        outside_temperature = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "outsidetemperature",
-            "outside_temperature",
-            None
-        )
+        outside_temperature = await self.async_get_data("outsidetemperature", "outside_temperature")
         return outside_temperature
 
     # Asynchronously get the filtered outside temperature.
     async def get_filtered_outside_temperature(self) -> float | None:
         """Retrieve the filtered outside temperature."""
-        filtered_outside_temperature = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "outsidetemperature",
-            "filtered_outside_temperature",
-            None
-        )
+        filtered_outside_temperature = await self.async_get_data("outsidetemperature", "filtered_outside_temperature")
         return filtered_outside_temperature
 
     # Asynchronously get notification hints.
     async def get_notification_hints(self) -> bool | None:
         """Retrieve notification hints."""
-        hints_present = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "notifications",
-            "hints_present",
-            None
-        )
+        hints_present = await self.async_get_data("notifications", "hints_present")
         return hints_present
 
     # Asynchronously get notification warnings.
     async def get_notification_warnings(self) -> bool | None:
         """Retrieve notification warnings."""
-        warnings_present = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "notifications",
-            "warnings_present",
-            None
-        )
+        warnings_present = await self.async_get_data("notifications", "warnings_present")
         return warnings_present
 
     # Asynchronously get notification errors.
     async def get_notification_errors(self) -> bool | None:
         """Retrieve notification errors."""
-        errors_present = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "notifications",
-            "error_present",
-            None
-        )
+        errors_present = await self.async_get_data("notifications", "error_present")
         return errors_present
 
     # Asynchronously get the global state.
     async def get_global_state(self) -> int | None:
         """Retrieve the global state of the climate control system."""
-        state = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "state",
-            "state",
-            None
-        )
+        state = await self.async_get_data("state", "state")
         return state
 
     # Asynchronously set the global state.
-    async def set_global_state(self, state: int) -> bool:
+    async def set_global_state(self, state: int) -> None:
         """Set the global state of the climate control system."""
-        payload = {"state": state}
-        return await self.hass.async_add_executor_job(
-            self.data_setter_helper,
-            "state",
-            payload
-        )
+        await self.write_queue.async_enqueue("state", "state", state)
 
     # Asynchronously get the global mode.
     async def get_global_mode(self) -> int | None:
         """Retrieve the global mode of the climate control system."""
-        mode = await self.hass.async_add_executor_job(
-            self.data_getter_helper,
-            "mode",
-            "mode",
-            None
-        )
+        mode = await self.async_get_data("mode", "mode")
         return mode
 
     # Asynchronously set the global mode.
-    async def set_global_mode(self, mode: int) -> bool:
+    async def set_global_mode(self, mode: int) -> None:
         """Set the global mode of the climate control system."""
-        payload = {"mode": mode}
-        return await self.hass.async_add_executor_job(
-            self.data_setter_helper,
-            "mode",
-            payload
-        )
+        await self.write_queue.async_enqueue("mode", "mode", mode)
+
+    @property
+    def zones_max_age(self) -> float:
+        """Return how long the zones data stays fresh: a gateway refresh period once it is known."""
+        return (self.cadence.period or self.zones_poll_interval) * self.load.stretch
+
+    # Asynchronously refresh the zones snapshot and the building-wide aggregates.
+    async def async_refresh_zones(self, max_age: float | None = None) -> dict[str, Any]:
+        """Refresh all the zones in one batch and recompute the aggregates, unless the snapshot is fresh."""
+        await self._async_refresh_zones_snapshot(self.zones_max_age if max_age is None else max_age)
+        return self.aggregates
+
+    async def _async_refresh_zones_snapshot(self, max_age: float) -> bool:
+        """Refresh the zones snapshot if older than max_age, returning whether any zone changed."""
+        async with self._zones_refresh_lock:
+            if self._zones_snapshot_time is not None and \
+                    time.monotonic() - self._zones_snapshot_time < max_age:
+                return False
+            version = sum(zone.data_version for zone in self.zones)
+            # Only read the zones consumed by an enabled entity.
+            zones = [zone for zone in self.zones if zone.endpoint in self._consumers]
+            # Spread the zones reads in batches to respect the bus capacity.
+            for i in range(0, len(zones), ZONES_REFRESH_BATCH_SIZE):
+                if i:
+                    await asyncio.sleep(ZONES_REFRESH_BATCH_INTERVAL)
+                await asyncio.gather(
+                    *(zone.get_zone_data(max_age=0) for zone in zones[i:i + ZONES_REFRESH_BATCH_SIZE])
+                )
+            self._zones_snapshot_time = time.monotonic()
+            # Skip the aggregation when no zone payload changed.
+            if sum(zone.data_version for zone in self.zones) == version and self.aggregates and \
+                    not self._aggregates_stale:
+                return False
+            # Defer the aggregation while shedding load, keeping the last aggregates meanwhile.
+            if self.load.shedding and self.aggregates:
+                self._aggregates_stale = True
+                return True
+            self.aggregates = compute_zones_aggregates(self.zones)
+            self._aggregates_stale = False
+            return True
+
+    # Invalidate the zones snapshot after a change affecting every zone.
+    @callback
+    def async_invalidate_zones(self) -> None:
+        """Invalidate the zones snapshot, coalescing close invalidations into a single bulk refresh."""
+        self._zones_snapshot_time = None
+        for zone in self.zones:
+            zone.data_time = None
+        if self._zones_invalidation_unsub is None:
+            self._zones_invalidation_unsub = async_call_later(
+                self.hass, ZONES_INVALIDATION_DELAY, self._async_bulk_refresh
+            )
+
+    async def _async_bulk_refresh(self, _now=None) -> None:
+        """Re-read all the zones at once and notify the entities depending on them."""
+        self._zones_invalidation_unsub = None
+        if await self._async_refresh_zones_snapshot(max_age=0):
+            async_dispatcher_send(self.hass, SIGNAL_ZONES_REFRESHED.format(self.id))
+        async_dispatcher_send(self.hass, SIGNAL_GLOBAL_REFRESHED.format(self.id))
+
+    async def _async_cadence_poll(self, _now=None) -> None:
+        """Poll the zones just after the expected gateway refresh, or probe a single zone while it is being learned.
+
+        Without a learned cadence the zones are polled at the zones poll interval. The next poll is
+        scheduled even if this one fails, so an unexpected answer cannot stop the polling.
+        """
+        self._cadence_unsub = None
+        try:
+            await self._async_cadence_cycle()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error polling the zones of %s", self.name)
+        # Under load, only every LOAD_SHED_STRETCH-th gateway refresh is polled.
+        delay = self.cadence.next_poll_delay(time.monotonic(), skip=self.load.stretch - 1)
+        if delay is None:
+            interval = self.cadence_probe_interval if self.cadence.learning(time.monotonic()) \
+                else self.zones_poll_interval
+            delay = interval * self.load.stretch
+        self._cadence_unsub = async_call_later(self.hass, delay, self._async_cadence_poll)
+
+    # Run a single cadence aligned poll of the zones.
+    async def _async_cadence_cycle(self) -> None:
+        """Poll the zones, or the zone probed while learning, and feed the cadence estimator."""
+        learning = self.cadence.learning(time.monotonic())
+        zones = [zone for zone in self.zones if zone.endpoint in self._consumers]
+        changed = False
+        if learning:
+            # One zone shows the gateway refreshes, the entities keep reading the others at their pace.
+            zones = zones[:1]
+            await asyncio.gather(*(zone.get_zone_data(max_age=0) for zone in zones))
+        elif zones:
+            changed = await self._async_refresh_zones_snapshot(max_age=0)
+        if zones:
+            version = (learning, sum(zone.data_version for zone in zones))
+            self.cadence.observe(time.monotonic(), self._cadence_version is not None and
+                                 version[0] == self._cadence_version[0] and version != self._cadence_version)
+            self._cadence_version = version
+        if changed:
+            async_dispatcher_send(self.hass, SIGNAL_ZONES_REFRESHED.format(self.id))
 
     # Helper function to set data on the shim server.
-    def data_setter_helper(self, endpoint, payload) -> bool:
-        """Helper function to send data to the shim server."""
-        r = requests.post(f"{self.shim_base_url}/{endpoint}", json=payload)
-        if r.status_code != 202:
-            _LOGGER.error(f"Error sending {payload} to {self.shim_base_url}/{endpoint}, code {r.status_code}")
-            return False
-        return True
+    def data_setter_helper(self, endpoint, payload) -> bool | None:
+        """Helper function to send data to the shim server, returning whether it was accepted, None if unreachable."""
+        try:
+            accepted = self.transport.post(endpoint, payload)
+        except GatewayUnreachable as e:
+            _LOGGER.debug("%s", e)
+            self.errors.record(False, endpoint)
+            return None
+        self.errors.record(True, endpoint)
+        return accepted
+
+    # Helper function to get a whole payload from the shim server.
+    def payload_getter_helper(self, endpoint) -> tuple[dict | None, bool]:
+        """Helper function to retrieve the payload of an endpoint, and whether it changed, from the shim server."""
+        try:
+            payload, modified = self.transport.get(endpoint)
+        except GatewayUnreachable as e:
+            _LOGGER.debug("%s", e)
+            self.errors.record(False, endpoint)
+            return None, False
+        # A request the shim server rejects still shows it is reachable.
+        self.errors.record(True, endpoint)
+        if payload is not None:
+            self._payloads[endpoint] = (time.monotonic(), payload)
+        return payload, modified
 
     # Helper function to get data from the shim server.
     def data_getter_helper(self, endpoint, key, default):
         """Helper function to retrieve data from the shim server."""
-        r = requests.get(f"{self.shim_base_url}/{endpoint}")
-        if r.status_code != 200:
-            _LOGGER.error(f"Error calling {self.shim_base_url}/{endpoint}, code {r.status_code}")
+        json_response, _ = self.payload_getter_helper(endpoint)
+        if json_response is None:
             return default
-        json_response = r.json()
         data = json_response.get(key)
         if data is None:
-            _LOGGER.error(f"Error retrieving data from {self.shim_base_url}/{endpoint}, "
-                          f"cannot access {key} in response: {json_response}")
+            self.errors.log(_LOGGER, f"{endpoint}/{key}",
+                            "Error retrieving data from %s/%s, cannot access %s in response: %s",
+                            self.transport.address, endpoint, key, json_response)
             return default
         return data
 
+# Class queuing the writes towards the shim server.
+class RehauNeasmart2WriteBehindQueue:
+    """Persistent write-behind queue of the writes towards the shim server.
+
+    Only the latest value for each endpoint and field is kept, the queue is persisted
+    through the Home Assistant storage and drained in order, one write at a time,
+    whenever the shim server is healthy. A write the shim server rejects is dropped,
+    only an unreachable shim server keeps it queued.
+    """
+
+    def __init__(self, hass: HomeAssistant, hub: RehauNeasmart2ClimateControlSystem, storage_key: str) -> None:
+        """Initialize the queue with its associated hub and storage key."""
+        self.hass = hass  # Home Assistant instance.
+        self.hub = hub  # Reference to the associated hub.
+        self._store = Store(hass, WRITE_QUEUE_STORAGE_VERSION, storage_key)  # Backing storage.
+        self._pending = OrderedDict()  # Pending writes, (endpoint, field) -> value, oldest first.
+        self._drain_task = None  # Task draining the queue, if running.
+        self._retry_unsub = None  # Cancels the scheduled drain retry, if any.
+        self._gateway_down = False  # Whether the last write attempt failed.
+
+    def __len__(self) -> int:
+        """Return the number of pending writes."""
+        return len(self._pending)
+
+    # Asynchronously restore the pending writes from the storage and resume draining.
+    async def async_load(self) -> None:
+        """Load the writes persisted before the last shutdown."""
+        stored = await self._store.async_load()
+        for endpoint, field, value in (stored or {}).get("pending", []):
+            self._pending[(endpoint, field)] = value
+        if self._pending:
+            _LOGGER.info("Restored %d pending writes for %s", len(self._pending), self.hub.name)
+            self._gateway_down = True
+            self._schedule_drain()
+
+    # Asynchronously stop draining and flush the pending writes to the storage.
+    async def async_shutdown(self) -> None:
+        """Stop draining the queue and persist the pending writes."""
+        if self._retry_unsub is not None:
+            self._retry_unsub()
+            self._retry_unsub = None
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        await self._store.async_save(self._data_to_save())
+
+    # Asynchronously accept a write, collapsing it with the pending one for the same field.
+    async def async_enqueue(self, endpoint: str, field: str, value: Any) -> None:
+        """Queue the write of field on endpoint and return as soon as it is accepted."""
+        self._pending.pop((endpoint, field), None)
+        self._pending[(endpoint, field)] = value
+        self._store.async_delay_save(self._data_to_save, WRITE_QUEUE_SAVE_DELAY)
+        if self._retry_unsub is None:
+            self._schedule_drain()
+
+    def queued(self, endpoint: str) -> dict[str, Any]:
+        """Return the values still queued for the fields of an endpoint."""
+        return {
+            field: value for (pending_endpoint, field), value in self._pending.items() if pending_endpoint == endpoint
+        }
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the pending writes in their storage format."""
+        return {"pending": [[endpoint, field, value] for (endpoint, field), value in self._pending.items()]}
+
+    @callback
+    def _schedule_drain(self, _now=None) -> None:
+        """Start draining the queue unless it is already being drained."""
+        self._retry_unsub = None
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = self.hass.async_create_background_task(
+                self._async_drain(), f"{DOMAIN} {self.hub.id} write queue drain"
+            )
+
+    async def _async_drain(self) -> None:
+        """Send the pending writes in order, backing off as soon as the shim server fails."""
+        if self._gateway_down and not await self.hub.test_connection():
+            self._schedule_retry()
+            return
+        while self._pending:
+            (endpoint, field), value = next(iter(self._pending.items()))
+            accepted = await self.hub.scheduler.async_run(
+                PRIORITY_WRITE, self.hub.data_setter_helper, endpoint, {field: value}
+            )
+            if accepted is None:
+                self._gateway_down = True
+                self._schedule_retry()
+                return
+            if not accepted:
+                # Retrying a rejected write would block the ones queued after it, even across restarts.
+                _LOGGER.error("%s rejected writing %s=%s to %s, dropping it",
+                              self.hub.transport.address, field, value, endpoint)
+            # Drop the write unless a newer value was queued while sending it.
+            if self._pending.get((endpoint, field)) == value:
+                del self._pending[(endpoint, field)]
+            if accepted and endpoint in GLOBAL_ENDPOINTS:
+                self.hub.async_invalidate_zones()
+            elif accepted:
+                # Make the next read of the written zone fetch its new value.
+                for zone in self.hub.zones:
+                    if zone.endpoint == endpoint:
+                        zone.data_time = None
+            self._store.async_delay_save(self._data_to_save, WRITE_QUEUE_SAVE_DELAY)
+        self._gateway_down = False
+
+    @callback
+    def _schedule_retry(self) -> None:
+        """Retry draining the queue once the retry interval has elapsed."""
+        self.hub.errors.log(_LOGGER, "write_queue", "%d writes for %s queued until the shim server is back",
+                            len(self._pending), self.hub.name, level=logging.WARNING)
+        self._retry_unsub = async_call_later(self.hass, self.hub.write_retry_interval, self._schedule_drain)
+
+# Compute the building-wide aggregates in a single pass over the zones snapshot.
+def compute_zones_aggregates(zones: list[RehauNeasmart2Zone]) -> dict[str, Any]:
+    """Compute mean, extremes and setpoint deviation of the zones with one pass over their last data."""
+    temperature_sum = 0.0
+    temperature_count = 0
+    humidity_sum = 0.0
+    humidity_count = 0
+    coldest = None
+    warmest = None
+    zones_below_setpoint = 0
+    total_setpoint_deviation = 0.0
+
+    for zone in zones:
+        data = zone.data
+        if not data:
+            continue
+        temperature = data.get("temperature")
+        humidity = data.get("relative_humidity")
+        setpoint = data.get("setpoint")
+        if humidity is not None:
+            humidity_sum += humidity
+            humidity_count += 1
+        if temperature is None:
+            continue
+        temperature_sum += temperature
+        temperature_count += 1
+        if coldest is None or temperature < coldest[1]:
+            coldest = (zone.name, temperature)
+        if warmest is None or temperature > warmest[1]:
+            warmest = (zone.name, temperature)
+        if setpoint is not None:
+            if temperature < setpoint:
+                zones_below_setpoint += 1
+            total_setpoint_deviation += abs(setpoint - temperature)
+
+    return {
+        "mean_temperature": round(temperature_sum / temperature_count, 2) if temperature_count else None,
+        "coldest_zone": coldest[0] if coldest else None,
+        "coldest_zone_temperature": coldest[1] if coldest else None,
+        "warmest_zone": warmest[0] if warmest else None,
+        "warmest_zone_temperature": warmest[1] if warmest else None,
+        "mean_humidity": round(humidity_sum / humidity_count, 2) if humidity_count else None,
+        "zones_below_setpoint": zones_below_setpoint if temperature_count else None,
+        "total_setpoint_deviation": round(total_setpoint_deviation, 2) if temperature_count else None,
+    }
+
 # Class representing a mixed group controlled by Rehau Neasmart 2.0.
 class RehauNeasmart2MixedGroup:
     """Rehau Neasmart 2.0 controlled Mixed Group"""
@@ -203,6 +1194,7 @@ class RehauNeasmart2MixedGroup:
         self.model = "Mixed Group w/ 24/230 Pump and 0-10v controlled mixing valve"  # Model of the mixed group.
         self.manufacturer = "Rehau"  # Manufacturer of the mixed group.
         self.mixg_id = mixedgroup_id  # ID of the mixed group.
+        self.endpoint = f"mixedgroups/{mixedgroup_id}"  # Shim server endpoint of the mixed group.
 
     @property
     def id(self) -> str:
@@ -212,45 +1204,25 @@ class RehauNeasmart2MixedGroup:
     # Asynchronously get the flow temperature of the mixed group.
     async def get_flow_temperature(self) -> float | None:
         """Retrieve the flow temperature for the mixed group."""
-        flow_temperature = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"mixedgroups/{self.mixg_id}",
-            "flow_temperature",
-            None
-        )
+        flow_temperature = await self.hub.async_get_data(self.endpoint, "flow_temperature")
         return flow_temperature
 
     # Asynchronously get the return temperature of the mixed group.
     async def get_return_temperature(self) -> float | None:
         """Retrieve the return temperature for the mixed group."""
-        return_temperature = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"mixedgroups/{self.mixg_id}",
-            "return_temperature",
-            None
-        )
+        return_temperature = await self.hub.async_get_data(self.endpoint, "return_temperature")
         return return_temperature
 
     # Asynchronously get the valve opening percentage of the mixed group.
     async def get_valve_opening_percentage(self) -> int | None:
         """Retrieve the valve opening percentage for the mixed group."""
-        valve_opening_percentage = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"mixedgroups/{self.mixg_id}",
-            "mixing_valve_opening_percentage",
-            None
-        )
+        valve_opening_percentage = await self.hub.async_get_data(self.endpoint, "mixing_valve_opening_percentage")
         return valve_opening_percentage
 
     # Asynchronously get the pump state of the mixed group.
     async def get_pump_state(self) -> str | None:
         """Retrieve the pump state for the mixed group."""
-        pump_state = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"mixedgroups/{self.mixg_id}",
-            "pump_state",
-            None
-        )
+        pump_state = await self.hub.async_get_data(self.endpoint, "pump_state")
         return pump_state
 
 # Class representing a dehumidifier controlled by Rehau Neasmart 2.0.
@@ -265,6 +1237,7 @@ class RehauNeasmart2Dehumidifier:
         self.model = "Dehumidifier with optional hydronic battery"  # Model of the dehumidifier.
         self.manufacturer = "Rehau"  # Manufacturer of the dehumidifier.
         self.dehumidifier_id = dehumidifier_id  # ID of the dehumidifier.
+        self.endpoint = f"dehumidifiers/{dehumidifier_id}"  # Shim server endpoint of the dehumidifier.
 
     @property
     def id(self) -> str:
@@ -274,12 +1247,7 @@ class RehauNeasmart2Dehumidifier:
     # Asynchronously get the state of the dehumidifier.
     async def get_dehumidifier_state(self) -> str | None:
         """Retrieve the state of the dehumidifier."""
-        dehumidifier_state = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"dehumidifiers/{self.dehumidifier_id}",
-            "dehumidifier_state",
-            None
-        )
+        dehumidifier_state = await self.hub.async_get_data(self.endpoint, "dehumidifier_state")
         return BINARY_STATUSES[dehumidifier_state]
 
 # Class representing an extra pump controlled by Rehau Neasmart 2.0.
@@ -294,6 +1262,7 @@ class RehauNeasmart2Pump:
         self.model = "On-Off 24/230v Pump"  # Model of the pump.
         self.manufacturer = "Rehau"  # Manufacturer of the pump.
         self.pump_id = pump_id  # ID of the pump.
+        self.endpoint = f"pumps/{pump_id}"  # Shim server endpoint of the pump.
 
     @property
     def id(self) -> str:
@@ -303,12 +1272,7 @@ class RehauNeasmart2Pump:
     # Asynchronously get the state of the pump.
     async def get_pump_state(self) -> str | None:
         """Retrieve the state of the pump."""
-        pump_state = await self.hub.hass.async_add_executor_job(
-            self.hub.data_getter_helper,
-            f"pumps/{self.pump_id}",
-            "pump_state",
-            None
-        )
+        pump_state = await self.hub.async_get_data(self.endpoint, "pump_state")
         return pump_state
 
 # Class representing a zone controlled by Rehau Neasmart 2.0.
@@ -322,8 +1286,13 @@ class RehauNeasmart2Zone:
         self.hub = hub  # Reference to the associated hub.
         self.zone_id = zone_id  # ID of the zone.
         self.base_id = base_id  # Base ID of the zone.
+        self.endpoint = f"zones/{base_id}/{zone_id}"  # Shim server endpoint of the zone.
         self.model = "Neasmart 2.0 Room Thermostat"  # Model of the zone.
         self.manufacturer = "Rehau"  # Manufacturer of the zone.
+        self.data = None  # Last zone data retrieved from the shim server.
+        self.data_time = None  # Monotonic time at which the zone data was retrieved.
+        self.data_version = 0  # Incremented each time the retrieved zone data changes.
+        self._data_lock = asyncio.Lock()  # Shares a single in-flight read between the zone entities.
 
     @property
     def id(self) -> str:
@@ -331,33 +1300,43 @@ class RehauNeasmart2Zone:
         return self._id
 
     # Asynchronously get the data of the zone.
-    async def get_zone_data(self) -> dict | None:
-        """Retrieve the data for the zone."""
-        r = await self.hub.hass.async_add_executor_job(
-            requests.get, f"{self.hub.shim_base_url}/zones/{self.base_id}/{self.zone_id}")
-        if r.status_code != 200:
-            _LOGGER.error(f"Error calling {self.hub.shim_base_url}/zones/{self.base_id}/{self.zone_id}, "
-                          f"code {r.status_code}")
-            return None
-        json_response = r.json()
-        return json_response
+    async def get_zone_data(self, max_age: float | None = None) -> dict | None:
+        """Retrieve the data for the zone, reusing the last one if younger than max_age.
+
+        The values still queued for the zone override the retrieved ones until they are written.
+        """
+        if max_age is None:
+            max_age = self.hub.zones_max_age
+        async with self._data_lock:
+            if self.data_time is None or time.monotonic() - self.data_time >= max_age:
+                json_response, modified = await self.hub.scheduler.async_run(
+                    PRIORITY_POLL,
+                    self.hub.payload_getter_helper,
+                    self.endpoint
+                )
+                if json_response is None:
+                    return None
+                self.data_time = time.monotonic()
+                if modified:
+                    self.data = json_response
+                    self.data_version += 1
+        queued = self.hub.write_queue.queued(self.endpoint) if self.hub.write_queue is not None else None
+        return {**self.data, **queued} if queued and self.data is not None else self.data
 
     # Asynchronously set the setpoint of the zone.
-    async def set_zone_setpoint(self, setpoint: float) -> bool:
+    async def set_zone_setpoint(self, setpoint: float) -> None:
         """Set the setpoint temperature for the zone."""
-        payload = {"setpoint": setpoint}
-        return await self.hub.hass.async_add_executor_job(
-            self.hub.data_setter_helper,
-            f"zones/{self.base_id}/{self.zone_id}",
-            payload
+        await self.hub.write_queue.async_enqueue(
+            self.endpoint,
+            "setpoint",
+            setpoint
         )
 
     # Asynchronously set the state of the zone.
-    async def set_zone_state(self, state: int) -> bool:
+    async def set_zone_state(self, state: int) -> None:
         """Set the state for the zone."""
-        payload = {"state": state}
-        return await self.hub.hass.async_add_executor_job(
-            self.hub.data_setter_helper,
-            f"zones/{self.base_id}/{self.zone_id}",
-            payload
+        await self.hub.write_queue.async_enqueue(
+            self.endpoint,
+            "state",
+            state
         )
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""Direct Modbus transport towards the Rehau Neasmart 2.0 Sysbus interface.
+
+pymodbus is not a requirement of the integration, this module is only imported when a Modbus
+transport is configured.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+from pymodbus.exceptions import ModbusException
+from pymodbus.pdu import ExceptionResponse
+
+from .const import (
+    MODBUS_MAX_BLOCK_SIZE,
+    MODBUS_SNAPSHOT_MAX_AGE,
+    REQUEST_TIMEOUT,
+    TRANSPORT_MODBUS_RTU
+)
+from .hub import GatewayUnreachable
+
+# Initialize a logger for this module.
+_LOGGER = logging.getLogger(__name__)
+
+# Holding registers layout of the Sysbus interface, as served by the Neasmart 2.0 Gateway add-on.
+GLOBAL_MODE_REG = 1
+GLOBAL_STATE_REG = 2
+OUTSIDE_TEMPERATURE_REG = 7
+FILTERED_OUTSIDE_TEMPERATURE_REG = 8
+HINTS_PRESENT_REG = 10
+WARNINGS_PRESENT_REG = 11
+ERRORS_PRESENT_REG = 12
+# First register of each mixed group, followed by pump state, valve opening, flow and return temperature.
+MIXEDGROUP_BASE_REGS = {1: 15, 2: 19, 3: 23}
+MIXEDGROUP_PUMP_STATE_OFFSET = 0
+MIXEDGROUP_VALVE_OPENING_OFFSET = 1
+MIXEDGROUP_FLOW_TEMPERATURE_OFFSET = 2
+MIXEDGROUP_RETURN_TEMPERATURE_OFFSET = 3
+# Registers of the dehumidifiers (1-9) and extra pumps (1-5) are base + index.
+DEHUMIDIFIER_BASE_REG = 39
+EXTRA_PUMP_BASE_REG = 49
+# First register of each base station zones, each zone taking ZONE_REGS_STRIDE registers.
+ZONE_BASE_REGS = {1: 100, 2: 1300, 3: 2500, 4: 3700}
+ZONE_REGS_STRIDE = 100
+ZONE_STATE_OFFSET = 0
+ZONE_SETPOINT_OFFSET = 1
+ZONE_TEMPERATURE_OFFSET = 2
+ZONE_RELATIVE_HUMIDITY_OFFSET = 10
+
+
+# Decode a KNX DPT 9.001 two bytes float, the encoding of the Sysbus temperatures.
+def dpt_9001_decode(raw: int) -> float:
+    """Decode a DPT 9.001 register value (MEEEEMMM MMMMMMMM, 0.01 resolution) into a float."""
+    exponent = (raw >> 11) & 0x0F
+    mantissa = raw & 0x07FF
+    if raw & 0x8000:
+        mantissa -= 0x0800
+    return round(0.01 * mantissa * (1 << exponent), 2)
+
+
+# Encode a float into a KNX DPT 9.001 two bytes float.
+def dpt_9001_encode(value: float) -> int:
+    """Encode a float into a DPT 9.001 register value."""
+    mantissa = value * 100
+    exponent = 0
+    while not -2048 <= round(mantissa) <= 2047:
+        mantissa /= 2
+        exponent += 1
+    if exponent > 15:
+        raise ValueError(f"{value} cannot be encoded as DPT 9.001")
+    mantissa = round(mantissa)
+    return (0x8000 if mantissa < 0 else 0) | (exponent << 11) | (mantissa & 0x07FF)
+
+
+# Map a REST shim endpoint to the registers holding its fields.
+def endpoint_registers(endpoint: str) -> dict[str, tuple[int, Callable[[int], Any]]]:
+    """Return the field -> (register, decoder) mapping equivalent to a REST shim endpoint."""
+    parts = endpoint.split("/")
+    if endpoint == "mode":
+        return {"mode": (GLOBAL_MODE_REG, int)}
+    if endpoint == "state":
+        return {"state": (GLOBAL_STATE_REG, int)}
+    if endpoint == "outsidetemperature":
+        return {
+            "outside_temperature": (OUTSIDE_TEMPERATURE_REG, dpt_9001_decode),
+            "filtered_outside_temperature": (FILTERED_OUTSIDE_TEMPERATURE_REG, dpt_9001_decode),
+        }
+    if endpoint == "notifications":
+        return {
+            "hints_present": (HINTS_PRESENT_REG, bool),
+            "warnings_present": (WARNINGS_PRESENT_REG, bool),
+            "error_present": (ERRORS_PRESENT_REG, bool),
+        }
+    if parts[0] == "mixedgroups" and len(parts) == 2:
+        base = MIXEDGROUP_BASE_REGS[int(parts[1])]
+        return {
+            "pump_state": (base + MIXEDGROUP_PUMP_STATE_OFFSET, int),
+            "mixing_valve_opening_percentage": (base + MIXEDGROUP_VALVE_OPENING_OFFSET, int),
+            "flow_temperature": (base + MIXEDGROUP_FLOW_TEMPERATURE_OFFSET, dpt_9001_decode),
+            "return_temperature": (base + MIXEDGROUP_RETURN_TEMPERATURE_OFFSET, dpt_9001_decode),
+        }
+    if parts[0] == "dehumidifiers" and len(parts) == 2:
+        return {"dehumidifier_state": (DEHUMIDIFIER_BASE_REG + int(parts[1]), int)}
+    if parts[0] == "pumps" and len(parts) == 2:
+        return {"pump_state": (EXTRA_PUMP_BASE_REG + int(parts[1]), int)}
+    if parts[0] == "zones" and len(parts) == 3:
+        base = ZONE_BASE_REGS[int(parts[1])] + (int(parts[2]) - 1) * ZONE_REGS_STRIDE
+        return {
+            "state": (base + ZONE_STATE_OFFSET, int),
+            "setpoint": (base + ZONE_SETPOINT_OFFSET, dpt_9001_decode),
+            "temperature": (base + ZONE_TEMPERATURE_OFFSET, dpt_9001_decode),
+            "relative_humidity": (base + ZONE_RELATIVE_HUMIDITY_OFFSET, int),
+        }
+    raise ValueError(f"Unsupported endpoint {endpoint}")
+
+
+# Encoders of the writable fields, the other ones are written as plain integers.
+FIELD_ENCODERS = {
+    "setpoint": dpt_9001_encode,
+}
+
+
+# Compute the contiguous register blocks covering a set of registers.
+def plan_register_blocks(addresses, max_count: int = MODBUS_MAX_BLOCK_SIZE) -> list[tuple[int, int]]:
+    """Return the fewest (start, count) reads of at most max_count registers covering all the addresses.
+
+    Each read starts at the lowest address not covered yet and spans every address within
+    max_count registers of it, whatever the holes in between: a bus round trip costs more
+    than the unused registers, and this greedy covering needs the fewest reads.
+    """
+    blocks = []
+    for address in sorted(set(addresses)):
+        if blocks and address - blocks[-1][0] < max_count:
+            blocks[-1] = (blocks[-1][0], address - blocks[-1][0] + 1)
+        else:
+            blocks.append((address, 1))
+    return blocks
+
+
+# Class reading the Sysbus holding registers directly, bypassing the REST shim.
+class RehauNeasmart2ModbusTransport:
+    """Modbus transport (RTU over a serial port, or TCP bridge) towards the Sysbus interface.
+
+    All the registers needed by the configured topology are read with the fewest contiguous
+    block reads, and the REST shim payloads are decoded from that snapshot.
+    """
+
+    def __init__(self, mode: str, host: str, port: int, serial_port: str | None,
+                 baudrate: int, slave_id: int, endpoints: list[str]) -> None:
+        """Initialize the transport for the given connection and configured endpoints."""
+        if mode == TRANSPORT_MODBUS_RTU:
+            self._client = ModbusSerialClient(port=serial_port, baudrate=baudrate, timeout=REQUEST_TIMEOUT)
+            self.address = serial_port  # Address of the Sysbus interface, used in logs.
+        else:
+            self._client = ModbusTcpClient(host, port=port, timeout=REQUEST_TIMEOUT)
+            self.address = f"{host}:{port}"
+        self._slave_id = slave_id  # Modbus slave id of the Sysbus interface.
+        self._lock = threading.Lock()  # Serializes the bus access across executor threads.
+        self._registers = {}  # Last read raw value of each register.
+        self._snapshot_time = None  # Monotonic time of the last successful block reads.
+        self._payloads = {}  # Last payload returned for each endpoint.
+        self.blocks = plan_register_blocks(
+            address for endpoint in endpoints for address, _ in endpoint_registers(endpoint).values()
+        )  # Contiguous (start, count) reads covering the configured topology.
+
+    def check_online(self) -> bool:
+        """Check the Sysbus interface answers a single register read.
+
+        Raises GatewayUnreachable when the Sysbus interface does not answer.
+        """
+        with self._lock:
+            return self._read_block(GLOBAL_MODE_REG, 1) is not None
+
+    def get(self, endpoint: str) -> tuple[dict | None, bool]:
+        """Return the payload of a REST shim endpoint decoded from the registers snapshot.
+
+        The payload is returned along with whether it changed since the last retrieval. Raises
+        GatewayUnreachable when the Sysbus interface does not answer, the payload is None when
+        it rejected the reads of all the endpoint registers.
+        """
+        fields = endpoint_registers(endpoint)
+        with self._lock:
+            if self._snapshot_time is None or time.monotonic() - self._snapshot_time >= MODBUS_SNAPSHOT_MAX_AGE:
+                self._refresh()
+            payload = {
+                field: decoder(self._registers[address])
+                for field, (address, decoder) in fields.items() if address in self._registers
+            }
+            if not payload:
+                return None, False
+            previous = self._payloads.get(endpoint)
+            if payload == previous:
+                return previous, False
+            self._payloads[endpoint] = payload
+            return payload, True
+
+    def post(self, endpoint: str, payload: dict) -> bool:
+        """Write the payload fields of a REST shim endpoint to their registers, returning whether they were accepted.
+
+        Raises GatewayUnreachable when the Sysbus interface does not answer, a field that cannot be
+        encoded or a write answered with a Modbus exception returns False.
+        """
+        fields = endpoint_registers(endpoint)
+        with self._lock:
+            # Make the next read observe the new values.
+            self._snapshot_time = None
+            for field, value in payload.items():
+                try:
+                    address, _ = fields[field]
+                    raw = FIELD_ENCODERS.get(field, int)(value)
+                except (KeyError, TypeError, ValueError) as e:
+                    _LOGGER.debug("Cannot write %s=%s to %s: %s", field, value, endpoint, e)
+                    return False
+                try:
+                    if not self._client.connected:
+                        self._client.connect()
+                    result = self._client.write_register(address, raw, slave=self._slave_id)
+                except ModbusException as e:
+                    raise GatewayUnreachable(
+                        f"Error writing {field} to register {address} on {self.address}: {e}"
+                    ) from e
+                if isinstance(result, ExceptionResponse):
+                    _LOGGER.debug("Error writing %s to register %d on %s: %s", field, address, self.address, result)
+                    return False
+                if result.isError():
+                    raise GatewayUnreachable(
+                        f"Error writing {field} to register {address} on {self.address}: {result}"
+                    )
+        return True
+
+    def set_endpoints(self, endpoints: list[str]) -> None:
+        """Re-plan the block reads for the endpoints in the poll plan."""
+        blocks = plan_register_blocks(
+            address for endpoint in endpoints for address, _ in endpoint_registers(endpoint).values()
+        )
+        if blocks != self.blocks:
+            self.blocks = blocks
+            # Make the next read cover the endpoints added to the plan.
+            self._snapshot_time = None
+
+    def set_timeout(self, timeout: float) -> None:
+        """Change the timeout of the next connections and reads."""
+        self._client.comm_params.timeout_connect = timeout
+
+    def close(self) -> None:
+        """Close the connection to the Sysbus interface."""
+        self._client.close()
+
+    def _refresh(self) -> None:
+        """Read all the planned blocks, replacing the registers snapshot.
+
+        The blocks answered with a Modbus exception are left out of the snapshot.
+        """
+        registers = {}
+        for start, count in self.blocks:
+            values = self._read_block(start, count)
+            if values is not None:
+                registers.update(zip(range(start, start + count), values))
+        self._registers = registers
+        self._snapshot_time = time.monotonic()
+
+    def _read_block(self, start: int, count: int) -> list[int] | None:
+        """Read count holding registers starting at start, None when answered with a Modbus exception.
+
+        Raises GatewayUnreachable when the Sysbus interface does not answer.
+        """
+        try:
+            if not self._client.connected:
+                self._client.connect()
+            result = self._client.read_holding_registers(start, count=count, slave=self._slave_id)
+        except ModbusException as e:
+            raise GatewayUnreachable(
+                f"Error reading registers {start}-{start + count - 1} on {self.address}: {e}"
+            ) from e
+        if isinstance(result, ExceptionResponse):
+            _LOGGER.debug("Error reading registers %d-%d on %s: %s", start, start + count - 1, self.address, result)
+            return None
+        if result.isError():
+            raise GatewayUnreachable(
+                f"Error reading registers {start}-{start + count - 1} on {self.address}: {result}"
+            )
+        return result.registers
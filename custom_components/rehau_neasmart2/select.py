@@ -1,6 +1,8 @@
 import logging
 from .const import DOMAIN, PRESET_STATES_MAPPING, PRESET_CLIMATE_MODES_MAPPING, \
-    PRESET_STATES_MAPPING_REVERSE, PRESET_CLIMATE_MODES_MAPPING_REVERSE
+    PRESET_STATES_MAPPING_REVERSE, PRESET_CLIMATE_MODES_MAPPING_REVERSE, SIGNAL_GLOBAL_REFRESHED
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.components.select import SelectEntity
@@ -44,8 +46,23 @@ class RehauNeasmart2GenericSelect(SelectEntity, RestoreEntity):
         """Indicate whether the device is available based on the hub's online status."""
         return self._device.hub.online
 
+    async def async_added_to_hass(self) -> None:
+        """Add the endpoint to the poll plan and subscribe to the bulk refresh following a global change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._device.hub.async_add_consumer([self._endpoint]))
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_GLOBAL_REFRESHED.format(self._device.hub.id), self._handle_global_refreshed
+        ))
+
+    @callback
+    def _handle_global_refreshed(self) -> None:
+        """Re-read the global option after a global change."""
+        self.async_schedule_update_ha_state(True)
+
 # Specific class for Rehau Neasmart2 global climate mode select entities.
 class RehauNeasmart2MasterGlobalModeSelect(RehauNeasmart2GenericSelect):
+    _endpoint = "mode"  # Shim server endpoint of the global climate mode.
+
     def __init__(self, device):
         """Initialize the global climate mode select entity."""
         super().__init__(device)
@@ -56,8 +73,7 @@ class RehauNeasmart2MasterGlobalModeSelect(RehauNeasmart2GenericSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Asynchronously select a global climate mode option."""
-        if not await self._device.set_global_mode(PRESET_CLIMATE_MODES_MAPPING[option]):
-            _LOGGER.error(f"Error configuring {option} global climate mode")  # Log an error if setting the mode fails.
+        await self._device.set_global_mode(PRESET_CLIMATE_MODES_MAPPING[option])
 
     async def async_update(self) -> None:
         """Asynchronously update the current global climate mode."""
@@ -65,10 +81,13 @@ class RehauNeasmart2MasterGlobalModeSelect(RehauNeasmart2GenericSelect):
         if mode is not None:
             self._attr_current_option = PRESET_CLIMATE_MODES_MAPPING_REVERSE[mode]  # Update the current option.
         else:
-            _LOGGER.error(f"Error updating global climate mode")  # Log an error if updating the mode fails.
+            # Log an error if updating the mode fails, unless the hub already reported the outage.
+            self._device.hub.errors.log(_LOGGER, self._attr_unique_id, "Error updating global climate mode")
 
 # Specific class for Rehau Neasmart2 global climate state select entities.
 class RehauNeasmart2MasterGlobalStateSelect(RehauNeasmart2GenericSelect):
+    _endpoint = "state"  # Shim server endpoint of the global climate state.
+
     def __init__(self, device):
         """Initialize the global climate state select entity."""
         super().__init__(device)
@@ -79,8 +98,7 @@ class RehauNeasmart2MasterGlobalStateSelect(RehauNeasmart2GenericSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Asynchronously select a global climate state option."""
-        if not await self._device.set_global_state(PRESET_STATES_MAPPING[option]):
-            _LOGGER.error(f"Error configuring {option} global climate state")  # Log an error if setting the state fails.
+        await self._device.set_global_state(PRESET_STATES_MAPPING[option])
 
     async def async_update(self) -> None:
         """Asynchronously update the current global climate state."""
@@ -88,4 +106,5 @@ class RehauNeasmart2MasterGlobalStateSelect(RehauNeasmart2GenericSelect):
         if state is not None:
             self._attr_current_option = PRESET_STATES_MAPPING_REVERSE[state]  # Update the current option.
         else:
-            _LOGGER.error(f"Error updating global climate state")  # Log an error if updating the state fails.
\ No newline at end of file
+            # Log an error if updating the state fails, unless the hub already reported the outage.
+            self._device.hub.errors.log(_LOGGER, self._attr_unique_id, "Error updating global climate state")
\ No newline at end of file
@@ -2,14 +2,17 @@
 
 import logging
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from homeassistant.const import (
+    EntityCategory,
     UnitOfTemperature,
     PERCENTAGE,
 )
-from .const import DOMAIN, PRESENCE_STATES, BINARY_STATUSES
+from .const import DOMAIN, PRESENCE_STATES, BINARY_STATUSES, SIGNAL_ZONES_REFRESHED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +28,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         RehauNeasmart2HintsPresentSensor(hub)
     ]
 
+    if hub.zones:
+        devices.append(RehauNeasmart2MeanTemperatureSensor(hub))
+        devices.append(RehauNeasmart2MeanHumiditySensor(hub))
+        devices.append(RehauNeasmart2ColdestZoneSensor(hub))
+        devices.append(RehauNeasmart2WarmestZoneSensor(hub))
+        devices.append(RehauNeasmart2ZonesBelowSetpointSensor(hub))
+        devices.append(RehauNeasmart2TotalSetpointDeviationSensor(hub))
+
     for mixg in hub.mixgs:
         devices.append(RehauNeasmart2MixedGroupFlowTemperatureSensor(mixg))
         devices.append(RehauNeasmart2MixedGroupReturnTemperatureSensor(mixg))
@@ -47,6 +58,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 class RehauNeasmart2GenericSensor(SensorEntity, RestoreEntity):
     _attr_has_entity_name = False
+    _deadband = None
 
     def __init__(self, device):
         self._device = device
@@ -69,8 +81,27 @@ class RehauNeasmart2GenericSensor(SensorEntity, RestoreEntity):
     def native_value(self) -> float | None:
         return self._state
 
+    @property
+    def _endpoints(self) -> list[str]:
+        return [self._device.endpoint]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._device.hub.async_add_consumer(self._endpoints))
+
+    def _update_state(self, value) -> None:
+        deadband = self._device.hub.deadbands.get(self._deadband)
+        if deadband and self._state is not None and abs(value - self._state) < deadband:
+            return
+        self._state = value
+
+    def _log_update_error(self) -> None:
+        self._device.hub.errors.log(_LOGGER, self._attr_unique_id, "Error updating %s", self._attr_unique_id)
+
 
 class RehauNeasmart2OutsideTemperatureSensor(RehauNeasmart2GenericSensor):
+    _deadband = "temperature"
+    _endpoints = ["outsidetemperature"]
     device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
@@ -82,12 +113,16 @@ class RehauNeasmart2OutsideTemperatureSensor(RehauNeasmart2GenericSensor):
     async def async_update(self) -> None:
         outside_temperature = await self._device.get_outside_temperature()
         if outside_temperature is not None:
-            self._state = outside_temperature
+            self._update_state(outside_temperature)
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_outside_temperature")
+            self._log_update_error()
 
 
 class RehauNeasmart2FilteredOutsideTemperatureSensor(RehauNeasmart2GenericSensor):
+    _deadband = "temperature"
+    _endpoints = ["outsidetemperature"]
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
     device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
@@ -99,12 +134,13 @@ class RehauNeasmart2FilteredOutsideTemperatureSensor(RehauNeasmart2GenericSensor
     async def async_update(self) -> None:
         filtered_outside_temperature = await self._device.get_filtered_outside_temperature()
         if filtered_outside_temperature is not None:
-            self._state = filtered_outside_temperature
+            self._update_state(filtered_outside_temperature)
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_filtered_outside_temperature")
+            self._log_update_error()
 
 
 class RehauNeasmart2ErrorsPresentSensor(RehauNeasmart2GenericSensor):
+    _endpoints = ["notifications"]
     device_class = "enum"
     _attr_options = list(PRESENCE_STATES.values())
     _state = PRESENCE_STATES[False]
@@ -119,10 +155,11 @@ class RehauNeasmart2ErrorsPresentSensor(RehauNeasmart2GenericSensor):
         if errors_present is not None:
             self._state = PRESENCE_STATES[errors_present]
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_errors_presence")
+            self._log_update_error()
 
 
 class RehauNeasmart2WarningsPresentSensor(RehauNeasmart2GenericSensor):
+    _endpoints = ["notifications"]
     device_class = "enum"
     _attr_options = list(PRESENCE_STATES.values())
     _state = PRESENCE_STATES[False]
@@ -137,10 +174,13 @@ class RehauNeasmart2WarningsPresentSensor(RehauNeasmart2GenericSensor):
         if warnings_present is not None:
             self._state = PRESENCE_STATES[warnings_present]
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_warnings_presence")
+            self._log_update_error()
 
 
 class RehauNeasmart2HintsPresentSensor(RehauNeasmart2GenericSensor):
+    _endpoints = ["notifications"]
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
     device_class = "enum"
     _attr_options = list(PRESENCE_STATES.values())
     _state = PRESENCE_STATES[False]
@@ -155,10 +195,11 @@ class RehauNeasmart2HintsPresentSensor(RehauNeasmart2GenericSensor):
         if hints_present is not None:
             self._state = PRESENCE_STATES[hints_present]
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_hints_presence")
+            self._log_update_error()
 
 
 class RehauNeasmart2MixedGroupFlowTemperatureSensor(RehauNeasmart2GenericSensor):
+    _deadband = "temperature"
     device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
@@ -170,12 +211,13 @@ class RehauNeasmart2MixedGroupFlowTemperatureSensor(RehauNeasmart2GenericSensor)
     async def async_update(self) -> None:
         flow_temperature = await self._device.get_flow_temperature()
         if flow_temperature is not None:
-            self._state = flow_temperature
+            self._update_state(flow_temperature)
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_mixedgroup_flow_temperature")
+            self._log_update_error()
 
 
 class RehauNeasmart2MixedGroupReturnTemperatureSensor(RehauNeasmart2GenericSensor):
+    _deadband = "temperature"
     device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
@@ -187,9 +229,9 @@ class RehauNeasmart2MixedGroupReturnTemperatureSensor(RehauNeasmart2GenericSenso
     async def async_update(self) -> None:
         return_temperature = await self._device.get_return_temperature()
         if return_temperature is not None:
-            self._state = return_temperature
+            self._update_state(return_temperature)
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_mixedgroup_return_temperature")
+            self._log_update_error()
 
 
 class RehauNeasmart2MixedGroupValveOpeningSensor(RehauNeasmart2GenericSensor):
@@ -205,7 +247,7 @@ class RehauNeasmart2MixedGroupValveOpeningSensor(RehauNeasmart2GenericSensor):
         if valve_opening is not None:
             self._state = valve_opening
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_valve_opening")
+            self._log_update_error()
 
 
 class RehauNeasmart2MixedGroupPumpStateSensor(RehauNeasmart2GenericSensor):
@@ -223,7 +265,7 @@ class RehauNeasmart2MixedGroupPumpStateSensor(RehauNeasmart2GenericSensor):
         if pump_status is not None:
             self._state = BINARY_STATUSES[pump_status]
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_mixedgroup_pump_state")
+            self._log_update_error()
 
 
 class RehauNeasmart2ExtraPumpStateSensor(RehauNeasmart2GenericSensor):
@@ -241,7 +283,7 @@ class RehauNeasmart2ExtraPumpStateSensor(RehauNeasmart2GenericSensor):
         if pump_status is not None:
             self._state = BINARY_STATUSES[pump_status]
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_extra_pump_state")
+            self._log_update_error()
 
 
 class RehauNeasmart2DehumidifierStateSensor(RehauNeasmart2GenericSensor):
@@ -256,11 +298,24 @@ class RehauNeasmart2DehumidifierStateSensor(RehauNeasmart2GenericSensor):
         if dehumidifier_status is not None:
             self._state = dehumidifier_status
         else:
-            _LOGGER.error(f"Error updating {self._device.id}_dehumidifier_state")
+            self._log_update_error()
+
 
+class RehauNeasmart2GenericZoneSensor(RehauNeasmart2GenericSensor):
 
-class RehauNeasmart2ZoneHumidity(RehauNeasmart2GenericSensor):
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_ZONES_REFRESHED.format(self._device.hub.id), self._handle_zones_refreshed
+        ))
 
+    @callback
+    def _handle_zones_refreshed(self) -> None:
+        self.async_schedule_update_ha_state(True)
+
+
+class RehauNeasmart2ZoneHumidity(RehauNeasmart2GenericZoneSensor):
+    _deadband = "humidity"
     device_class = SensorDeviceClass.HUMIDITY
     _attr_native_unit_of_measurement = PERCENTAGE
 
@@ -272,11 +327,12 @@ class RehauNeasmart2ZoneHumidity(RehauNeasmart2GenericSensor):
     async def async_update(self) -> None:
         zone_data = await self._device.get_zone_data()
         if zone_data is not None and zone_data.get("relative_humidity") is not None:
-            self._state = zone_data["relative_humidity"]
+            self._update_state(zone_data["relative_humidity"])
         else:
-            _LOGGER.error(f"Error updating {self._attr_unique_id} thermostat")
+            self._log_update_error()
 
-class RehauNeasmart2ZoneTemperature(RehauNeasmart2GenericSensor):
+class RehauNeasmart2ZoneTemperature(RehauNeasmart2GenericZoneSensor):
+    _deadband = "temperature"
     device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
@@ -288,6 +344,91 @@ class RehauNeasmart2ZoneTemperature(RehauNeasmart2GenericSensor):
     async def async_update(self) -> None:
         zone_data = await self._device.get_zone_data()
         if zone_data is not None and zone_data.get("temperature") is not None:
-            self._state = zone_data["temperature"]
+            self._update_state(zone_data["temperature"])
         else:
-            _LOGGER.error(f"Error updating {self._attr_unique_id} thermostat")
\ No newline at end of file
+            self._log_update_error()
+
+class RehauNeasmart2ZonesAggregateSensor(RehauNeasmart2GenericZoneSensor):
+    _aggregate_key: str
+
+    @property
+    def _endpoints(self) -> list[str]:
+        return [zone.endpoint for zone in self._device.zones]
+
+    async def async_update(self) -> None:
+        aggregates = await self._device.async_refresh_zones()
+        value = aggregates.get(self._aggregate_key)
+        if value is not None:
+            self._update_state(value)
+        else:
+            self._log_update_error()
+
+
+class RehauNeasmart2MeanTemperatureSensor(RehauNeasmart2ZonesAggregateSensor):
+    _deadband = "temperature"
+    device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _aggregate_key = "mean_temperature"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_mean_temperature"
+        self._attr_name = f"{self._device.name} Mean Temperature"
+
+
+class RehauNeasmart2MeanHumiditySensor(RehauNeasmart2ZonesAggregateSensor):
+    _deadband = "humidity"
+    device_class = SensorDeviceClass.HUMIDITY
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _aggregate_key = "mean_humidity"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_mean_humidity"
+        self._attr_name = f"{self._device.name} Mean Humidity"
+
+
+class RehauNeasmart2ColdestZoneSensor(RehauNeasmart2ZonesAggregateSensor):
+    _aggregate_key = "coldest_zone"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_coldest_zone"
+        self._attr_name = f"{self._device.name} Coldest Zone"
+
+    @property
+    def extra_state_attributes(self):
+        return {"temperature": self._device.aggregates.get("coldest_zone_temperature")}
+
+
+class RehauNeasmart2WarmestZoneSensor(RehauNeasmart2ZonesAggregateSensor):
+    _aggregate_key = "warmest_zone"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_warmest_zone"
+        self._attr_name = f"{self._device.name} Warmest Zone"
+
+    @property
+    def extra_state_attributes(self):
+        return {"temperature": self._device.aggregates.get("warmest_zone_temperature")}
+
+
+class RehauNeasmart2ZonesBelowSetpointSensor(RehauNeasmart2ZonesAggregateSensor):
+    _aggregate_key = "zones_below_setpoint"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_zones_below_setpoint"
+        self._attr_name = f"{self._device.name} Zones Below Setpoint"
+
+
+class RehauNeasmart2TotalSetpointDeviationSensor(RehauNeasmart2ZonesAggregateSensor):
+    _deadband = "temperature"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _aggregate_key = "total_setpoint_deviation"
+
+    def __init__(self, device):
+        super().__init__(device)
+        self._attr_unique_id = f"{self._device.id}_total_setpoint_deviation"
+        self._attr_name = f"{self._device.name} Total Setpoint Deviation"
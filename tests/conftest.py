@@ -0,0 +1,6 @@
+"""Shared setup of the Rehau Neasmart 2.0 integration tests."""
+import os
+import sys
+
+# Import the integration as custom_components.rehau_neasmart2, as Home Assistant does.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
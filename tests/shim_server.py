@@ -0,0 +1,169 @@
+"""Stand-in REST shim server, serving the Neasmart 2.0 Gateway endpoints over TCP or a Unix socket."""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import json
+import os
+import socketserver
+import threading
+import time
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+class ShimServer:
+    """REST shim server answering from an in-memory endpoint -> payload mapping.
+
+    ETags are sent unless disabled, and the wire format follows the Accept header among the
+    formats enabled. A status forced for an endpoint replaces its answer, to inject failures,
+    and a delay holds it, to simulate a slow gateway.
+    """
+
+    def __init__(self, payloads: dict[str, Any], socket_path: str | None = None, etags: bool = True,
+                 formats: tuple[str, ...] = ("application/json",)) -> None:
+        self.payloads = payloads  # Payload served by each endpoint, updated by the POSTs.
+        self.etags = etags  # Whether the answers carry an ETag.
+        self.formats = formats  # Content types the server is able to encode.
+        self.statuses = {}  # Status forced for some endpoints.
+        self.delays = {}  # Delay (seconds) before answering some endpoints, "health" included.
+        self.connections = 0  # Connections accepted.
+        self.in_flight = 0  # Requests being answered.
+        self.max_in_flight = 0  # Most requests answered at once.
+        self.requests = []  # (method, endpoint, status) of every request served.
+        self.content_types = []  # Content type of every payload served.
+        self._lock = threading.Lock()
+        if socket_path is None:
+            self._server = ThreadingHTTPServer(("127.0.0.1", 0), _TcpHandler)
+            self.base_url = "http://127.0.0.1:{}".format(self._server.server_address[1])
+        else:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self._server = _UnixHTTPServer(socket_path, _Handler)
+            self.base_url = None
+        self.socket_path = socket_path
+        self._server.shim = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> ShimServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(5)
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def served(self, endpoint: str) -> list[int]:
+        """Return the statuses of the GETs served for an endpoint."""
+        with self._lock:
+            return [status for method, path, status in self.requests if method == "GET" and path == endpoint]
+
+    def _enter(self, endpoint: str) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delays.get(endpoint, 0))
+
+    def _record(self, method: str, endpoint: str, status: int) -> None:
+        with self._lock:
+            self.requests.append((method, endpoint, status))
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address.
+        return request, ("unix", 0)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep the connections alive, as the shim server does.
+
+    def setup(self) -> None:
+        with self.server.shim._lock:
+            self.server.shim.connections += 1
+        super().setup()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        shim = self.server.shim
+        endpoint = self.path.lstrip("/")
+        shim._enter(endpoint)
+        if endpoint == "health":
+            return self._answer("GET", endpoint, 200, b"OK", "text/plain")
+        if endpoint in shim.statuses:
+            return self._answer("GET", endpoint, shim.statuses[endpoint], b"", "text/plain")
+        if endpoint not in shim.payloads:
+            return self._answer("GET", endpoint, 404, b"", "text/plain")
+        content_type = self._content_type(shim)
+        body = _ENCODERS[content_type](shim.payloads[endpoint])
+        shim.content_types.append(content_type)
+        headers = {}
+        if shim.etags:
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+            if self.headers.get("If-None-Match") == etag:
+                return self._answer("GET", endpoint, 304, b"", None, {"ETag": etag})
+            headers["ETag"] = etag
+        self._answer("GET", endpoint, 200, body, content_type, headers)
+
+    def do_POST(self) -> None:
+        shim = self.server.shim
+        endpoint = self.path.lstrip("/")
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        shim._enter(endpoint)
+        if endpoint in shim.statuses:
+            return self._answer("POST", endpoint, shim.statuses[endpoint], b"", "text/plain")
+        if endpoint not in shim.payloads:
+            return self._answer("POST", endpoint, 404, b"", "text/plain")
+        shim.payloads[endpoint] = {**shim.payloads[endpoint], **body}
+        self._answer("POST", endpoint, 202, b"", "text/plain")
+
+    def _content_type(self, shim: ShimServer) -> str:
+        offered = [media_type.split(";")[0].strip() for media_type in self.headers.get("Accept", "").split(",")]
+        for content_type in offered:
+            if content_type in shim.formats and content_type in _ENCODERS:
+                return content_type
+        return "application/json"
+
+    def _answer(self, method: str, endpoint: str, status: int, body: bytes, content_type: str | None,
+                headers: dict[str, str] | None = None) -> None:
+        shim = self.server.shim
+        shim._record(method, endpoint, status)
+        with shim._lock:
+            shim.in_flight -= 1
+        self.send_response(status)
+        if content_type is not None:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+class _TcpHandler(_Handler):
+    # Headers and body are written separately, Nagle would hold the body for a delayed ACK.
+    disable_nagle_algorithm = True
+
+
+_ENCODERS = {"application/json": lambda payload: json.dumps(payload).encode()}
+if msgpack is not None:
+    _ENCODERS["application/msgpack"] = msgpack.packb
+if cbor2 is not None:
+    _ENCODERS["application/cbor"] = cbor2.dumps
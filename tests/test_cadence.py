@@ -0,0 +1,83 @@
+"""Tests of the gateway refresh cadence estimator and of the aligned zones polling."""
+import asyncio
+import random
+from types import SimpleNamespace
+
+import requests
+
+from custom_components.rehau_neasmart2.const import (
+    CADENCE_LEARNING_TIMEOUT,
+    CADENCE_POLL_OFFSET,
+    CADENCE_PROBE_INTERVAL,
+    CADENCE_RELEARN_DELAY,
+)
+from custom_components.rehau_neasmart2 import hub as hub_module
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2CadenceEstimator, RehauNeasmart2ClimateControlSystem
+
+
+def probe(estimator, now, until, refresh_changed):
+    """Probe until the given time, or the cadence is known, returning the time reached."""
+    last = now
+    while now < until and estimator.period is None:
+        estimator.observe(now, refresh_changed(last, now))
+        last = now
+        delay = estimator.next_poll_delay(now)
+        now += CADENCE_PROBE_INTERVAL if delay is None else delay
+    return now
+
+
+def test_learns_period_and_phase():
+    rnd = random.Random(1)
+    period, phase = 30, 7
+
+    def refresh_changed(last, now):
+        # Some refreshes leave the values unchanged.
+        return (now - phase) // period != (last - phase) // period and rnd.random() < 0.8
+
+    estimator = RehauNeasmart2CadenceEstimator()
+    now = probe(estimator, 1000, 1000 + CADENCE_LEARNING_TIMEOUT, refresh_changed)
+    assert now < 1000 + CADENCE_LEARNING_TIMEOUT
+    assert abs(estimator.period - period) < 0.5
+    # The next poll lands just after a refresh.
+    poll = now + estimator.next_poll_delay(now)
+    assert 0 < (poll - phase) % period <= CADENCE_POLL_OFFSET + CADENCE_PROBE_INTERVAL
+
+
+def test_gives_up_on_stable_values_and_learns_again_later():
+    estimator = RehauNeasmart2CadenceEstimator()
+    now = probe(estimator, 0, 2 * CADENCE_LEARNING_TIMEOUT, lambda last, now: False)
+    assert estimator.period is None
+    assert not estimator.learning(now)
+    assert not estimator.learning(CADENCE_LEARNING_TIMEOUT + CADENCE_RELEARN_DELAY - 1)
+    assert estimator.learning(CADENCE_LEARNING_TIMEOUT + CADENCE_RELEARN_DELAY)
+
+
+def test_changes_on_every_probe_do_not_lock():
+    # A refresh faster than the probes cannot be told apart from noise.
+    estimator = RehauNeasmart2CadenceEstimator()
+    now = probe(estimator, 0, 2 * CADENCE_LEARNING_TIMEOUT, lambda last, now: True)
+    assert estimator.period is None
+    assert not estimator.learning(now)
+
+
+def test_polling_goes_on_after_unexpected_errors(monkeypatch, caplog):
+    scheduled = []
+    monkeypatch.setattr(hub_module, "async_call_later", lambda hass, delay, action: scheduled.append(delay))
+
+    def malformed_answer(endpoint):
+        raise requests.JSONDecodeError("Expecting value", "<html>", 0)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        hass = SimpleNamespace(
+            loop=loop, async_add_executor_job=lambda job, *args: loop.run_in_executor(None, job, *args)
+        )
+        hub = RehauNeasmart2ClimateControlSystem(hass, "Test", "127.0.0.1", 9, "A", 0, "", "")
+        hub.async_add_consumer([hub.zones[0].endpoint])
+        hub.payload_getter_helper = malformed_answer
+        await hub._async_cadence_poll()
+        hub.transport.close()
+
+    asyncio.run(run())
+    assert scheduled == [CADENCE_PROBE_INTERVAL]
+    assert "Unexpected error polling the zones" in caplog.text
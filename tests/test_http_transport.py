@@ -0,0 +1,117 @@
+"""Tests of the HTTP transport against the stand-in shim server."""
+import os
+
+import pytest
+
+from custom_components.rehau_neasmart2.hub import GatewayUnreachable, RehauNeasmart2HttpTransport
+from tests.shim_server import ShimServer
+
+ZONE = {"state": 1, "setpoint": 21.5, "temperature": 20.3, "relative_humidity": 45}
+
+
+@pytest.fixture
+def shim():
+    with ShimServer({"zones/1/1": dict(ZONE), "mode": {"mode": 1}}) as server:
+        yield server
+
+
+@pytest.fixture
+def transport(shim):
+    transport = RehauNeasmart2HttpTransport(shim.base_url)
+    yield transport
+    transport.close()
+
+
+def test_304_reuses_the_decoded_payload(shim, transport):
+    payload, modified = transport.get("zones/1/1")
+    assert payload == ZONE
+    assert modified
+    again, modified = transport.get("zones/1/1")
+    assert again is payload
+    assert not modified
+    assert shim.served("zones/1/1") == [200, 304]
+
+
+def test_etag_change_downloads_the_new_payload(shim, transport):
+    transport.get("zones/1/1")
+    shim.payloads["zones/1/1"]["temperature"] = 20.4
+    payload, modified = transport.get("zones/1/1")
+    assert payload["temperature"] == 20.4
+    assert modified
+    assert shim.served("zones/1/1") == [200, 200]
+
+
+def test_without_etag_the_content_is_compared(shim, transport):
+    shim.etags = False
+    payload, modified = transport.get("zones/1/1")
+    assert modified
+    # A 200 carrying the same content is not a change.
+    again, modified = transport.get("zones/1/1")
+    assert again == payload
+    assert not modified
+    shim.payloads["zones/1/1"]["setpoint"] = 22.0
+    payload, modified = transport.get("zones/1/1")
+    assert payload["setpoint"] == 22.0
+    assert modified
+    assert shim.served("zones/1/1") == [200, 200, 200]
+
+
+def test_dropped_endpoints_are_forgotten(shim, transport):
+    transport.get("zones/1/1")
+    transport.set_endpoints(["mode"])
+    payload, modified = transport.get("zones/1/1")
+    assert payload == ZONE
+    assert modified
+    assert shim.served("zones/1/1") == [200, 200]
+
+
+def test_rejected_and_failed_requests(shim, transport):
+    shim.statuses["zones/1/1"] = 404
+    assert transport.get("zones/1/1") == (None, False)
+    assert not transport.post("zones/1/1", {"setpoint": 22.0})
+    shim.statuses["zones/1/1"] = 503
+    with pytest.raises(GatewayUnreachable):
+        transport.get("zones/1/1")
+    with pytest.raises(GatewayUnreachable):
+        transport.post("zones/1/1", {"setpoint": 22.0})
+    del shim.statuses["zones/1/1"]
+    assert transport.post("zones/1/1", {"setpoint": 22.0})
+    assert shim.payloads["zones/1/1"]["setpoint"] == 22.0
+
+
+def test_unanswered_requests():
+    with ShimServer({}) as shim:
+        base_url = shim.base_url
+    transport = RehauNeasmart2HttpTransport(base_url)
+    transport.set_timeout(1)
+    with pytest.raises(GatewayUnreachable):
+        transport.check_online()
+    with pytest.raises(GatewayUnreachable):
+        transport.get("mode")
+    with pytest.raises(GatewayUnreachable):
+        transport.post("mode", {"mode": 1})
+
+
+@pytest.mark.parametrize("module,content_type", [("msgpack", "application/msgpack"), ("cbor2", "application/cbor")])
+def test_negotiates_the_compact_formats(shim, transport, module, content_type):
+    pytest.importorskip(module)
+    shim.formats = (content_type, "application/json")
+    assert transport.get("zones/1/1") == (ZONE, True)
+    assert shim.content_types == [content_type]
+
+
+def test_falls_back_to_json(shim, transport):
+    assert transport.get("zones/1/1") == (ZONE, True)
+    assert shim.content_types == ["application/json"]
+
+
+def test_unix_socket(tmp_path):
+    socket_path = os.path.join(tmp_path, "gateway.sock")
+    with ShimServer({"mode": {"mode": 2}}, socket_path=socket_path):
+        transport = RehauNeasmart2HttpTransport("", socket_path)
+        try:
+            assert transport.check_online()
+            assert transport.get("mode") == ({"mode": 2}, True)
+            assert transport.get("mode") == ({"mode": 2}, False)
+        finally:
+            transport.close()
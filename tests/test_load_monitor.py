@@ -0,0 +1,34 @@
+"""Tests of the executor backlog inspection of the load monitor."""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2LoadMonitor, _executor_queue_depth
+
+
+def test_executor_queue_depth():
+    loop = asyncio.new_event_loop()
+    try:
+        hass = SimpleNamespace(loop=loop)
+        # No default executor until the first job, as on a loop Home Assistant did not set up.
+        assert _executor_queue_depth(hass) is None
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        assert _executor_queue_depth(hass) == 0
+    finally:
+        loop.close()
+
+
+def test_uninspectable_queue_is_logged_once(caplog):
+    loop = asyncio.new_event_loop()
+    try:
+        monitor = RehauNeasmart2LoadMonitor(SimpleNamespace(loop=loop))
+        with caplog.at_level(logging.DEBUG, logger="custom_components.rehau_neasmart2.hub"):
+            for _ in range(3):
+                monitor._expected = loop.time()
+                monitor._probe()
+                monitor.async_stop()
+        assert monitor.executor_queue == 0
+        assert len([r for r in caplog.records if "cannot be inspected" in r.message]) == 1
+    finally:
+        loop.close()
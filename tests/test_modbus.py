@@ -0,0 +1,179 @@
+"""Tests of the Modbus transport against a pymodbus simulator of the Sysbus interface."""
+import asyncio
+import socket
+import threading
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext, ModbusSlaveContext
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.server import ModbusTcpServer
+
+from custom_components.rehau_neasmart2.const import MODBUS_MAX_BLOCK_SIZE, TRANSPORT_MODBUS_TCP
+from custom_components.rehau_neasmart2.hub import GatewayUnreachable
+from custom_components.rehau_neasmart2.modbus import (
+    ZONE_BASE_REGS,
+    ZONE_SETPOINT_OFFSET,
+    ZONE_STATE_OFFSET,
+    ZONE_TEMPERATURE_OFFSET,
+    ZONE_RELATIVE_HUMIDITY_OFFSET,
+    RehauNeasmart2ModbusTransport,
+    dpt_9001_decode,
+    dpt_9001_encode,
+    endpoint_registers,
+    plan_register_blocks,
+)
+
+# Function code of the holding registers in the simulator datastore.
+HOLDING_REGISTERS = 3
+# Endpoints of the largest topology: 4 base stations of 12 zones, 3 mixed groups, 5 pumps, 9 dehumidifiers.
+FULL_TOPOLOGY = ["mode", "state", "outsidetemperature", "notifications"] + \
+    [f"mixedgroups/{m}" for m in range(1, 4)] + [f"pumps/{p}" for p in range(1, 6)] + \
+    [f"dehumidifiers/{d}" for d in range(1, 10)] + \
+    [f"zones/{b}/{z}" for b in range(1, 5) for z in range(1, 13)]
+
+
+class BoundedSlaveContext(ModbusSlaveContext):
+    """Holding registers answering the accesses beyond size with an illegal address exception."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(hr=ModbusSequentialDataBlock(0, [0] * (size + 1)))
+        self.size = size
+
+    def getValues(self, fc_as_hex, address, count=1):
+        if address + count > self.size:
+            return ExceptionResponse.ILLEGAL_ADDRESS
+        return super().getValues(fc_as_hex, address, count)
+
+    def setValues(self, fc_as_hex, address, values):
+        if address + len(values) > self.size:
+            return ExceptionResponse.ILLEGAL_ADDRESS
+        return super().setValues(fc_as_hex, address, values)
+
+
+class SysbusSimulator:
+    """pymodbus TCP server serving the Sysbus holding registers from a background thread."""
+
+    def __init__(self, size: int = 5000) -> None:
+        self.context = ModbusServerContext(slaves=BoundedSlaveContext(size), single=True)
+        self.reads = 0  # Read holding registers requests received.
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(5)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    def set(self, address: int, value: int) -> None:
+        self.context[0].setValues(HOLDING_REGISTERS, address, [value])
+
+    def get(self, address: int) -> int:
+        return self.context[0].getValues(HOLDING_REGISTERS, address, 1)[0]
+
+    async def _start(self) -> None:
+        self._server = ModbusTcpServer(self.context, address=("127.0.0.1", self.port), trace_pdu=self._trace)
+        await self._server.listen()
+
+    def _trace(self, sending: bool, pdu):
+        if not sending and pdu.function_code == HOLDING_REGISTERS:
+            self.reads += 1
+        return pdu
+
+
+@pytest.fixture
+def simulator():
+    sysbus = SysbusSimulator()
+    sysbus.start()
+    yield sysbus
+    sysbus.stop()
+
+
+def test_dpt_9001_round_trip():
+    for value in (-30.5, -0.01, 0, 0.01, 20.3, 21.5, 85.12, 670760.96):
+        assert dpt_9001_decode(dpt_9001_encode(value)) == pytest.approx(value, rel=1e-3, abs=0.01)
+    with pytest.raises(ValueError):
+        dpt_9001_encode(1e9)
+
+
+def test_plan_pairs_neighbouring_zones():
+    addresses = [address for endpoint in FULL_TOPOLOGY for address, _ in endpoint_registers(endpoint).values()]
+    blocks = plan_register_blocks(addresses)
+    covered = {address for start, count in blocks for address in range(start, start + count)}
+    assert covered >= set(addresses)
+    assert all(count <= MODBUS_MAX_BLOCK_SIZE for _, count in blocks)
+    # Globals and the first zone share a read, then two zones per read: 25 reads instead of one per zone.
+    assert len(blocks) == 25
+    assert (ZONE_BASE_REGS[1] + 100, 111) in blocks
+
+
+def test_plan_splits_at_block_size():
+    assert plan_register_blocks([0, 124, 125, 300], max_count=125) == [(0, 125), (125, 1), (300, 1)]
+    assert plan_register_blocks([]) == []
+
+
+def test_reads_and_writes_through_the_simulator(simulator):
+    zone = ZONE_BASE_REGS[2] + 3 * 100
+    simulator.set(zone + ZONE_STATE_OFFSET, 1)
+    simulator.set(zone + ZONE_SETPOINT_OFFSET, dpt_9001_encode(21.5))
+    simulator.set(zone + ZONE_TEMPERATURE_OFFSET, dpt_9001_encode(20.3))
+    simulator.set(zone + ZONE_RELATIVE_HUMIDITY_OFFSET, 45)
+    transport = RehauNeasmart2ModbusTransport(
+        TRANSPORT_MODBUS_TCP, "127.0.0.1", simulator.port, None, 0, 1, FULL_TOPOLOGY
+    )
+    try:
+        assert transport.check_online()
+        reads = simulator.reads
+        payload, modified = transport.get("zones/2/4")
+        assert payload == {"state": 1, "setpoint": 21.5, "temperature": 20.3, "relative_humidity": 45}
+        assert modified
+        # The whole topology is read with the planned blocks, and served from the snapshot afterwards.
+        assert simulator.reads - reads == len(transport.blocks)
+        payload, modified = transport.get("zones/2/4")
+        assert not modified
+        assert simulator.reads - reads == len(transport.blocks)
+
+        assert transport.post("zones/2/4", {"setpoint": 22.0})
+        assert dpt_9001_decode(simulator.get(zone + ZONE_SETPOINT_OFFSET)) == 22.0
+        payload, modified = transport.get("zones/2/4")
+        assert payload["setpoint"] == 22.0
+        assert modified
+        # A value that cannot be encoded is rejected without reaching the bus.
+        assert not transport.post("zones/2/4", {"setpoint": 1e9})
+    finally:
+        transport.close()
+
+
+def test_rejected_blocks_and_unanswered_reads():
+    # Only the first base station registers exist, the others are answered with an exception.
+    sysbus = SysbusSimulator(size=ZONE_BASE_REGS[2])
+    sysbus.start()
+    transport = RehauNeasmart2ModbusTransport(
+        TRANSPORT_MODBUS_TCP, "127.0.0.1", sysbus.port, None, 0, 1, ["mode", "zones/1/1", "zones/2/1"]
+    )
+    try:
+        assert transport.get("zones/2/1") == (None, False)
+        payload, _ = transport.get("zones/1/1")
+        assert set(payload) == {"state", "setpoint", "temperature", "relative_humidity"}
+        assert not transport.post("zones/2/1", {"state": 1})
+    finally:
+        sysbus.stop()
+    transport.set_timeout(1)
+    transport.close()
+    with pytest.raises(GatewayUnreachable):
+        transport.check_online()
+    transport.set_endpoints(["mode"])
+    with pytest.raises(GatewayUnreachable):
+        transport.get("mode")
+    with pytest.raises(GatewayUnreachable):
+        transport.post("mode", {"mode": 1})
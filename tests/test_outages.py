@@ -0,0 +1,63 @@
+"""Tests of the outage accounting of the hub requests."""
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.rehau_neasmart2.const import OUTAGE_FAILURE_THRESHOLD
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2ClimateControlSystem
+from tests.shim_server import ShimServer
+
+ZONE = {"state": 1, "setpoint": 21.5, "temperature": 20.3, "relative_humidity": 45}
+
+
+@pytest.fixture
+def shim():
+    with ShimServer({f"zones/1/{z}": dict(ZONE) for z in range(1, 5)}) as server:
+        yield server
+
+
+@pytest.fixture
+def hub(shim):
+    # The requests helpers run in the executor, they only need the hub and its transport.
+    hub = RehauNeasmart2ClimateControlSystem(
+        SimpleNamespace(), "Test", "127.0.0.1", int(shim.base_url.rsplit(":", 1)[1]), "A,B,C,D", 0, "", ""
+    )
+    hub.transport.set_timeout(1)
+    yield hub
+    hub.transport.close()
+
+
+def test_rejected_requests_do_not_open_an_outage(shim, hub):
+    for z in range(1, 4):
+        shim.statuses[f"zones/1/{z}"] = 404
+    for _ in range(OUTAGE_FAILURE_THRESHOLD):
+        for z in range(1, 4):
+            assert hub.payload_getter_helper(f"zones/1/{z}") == (None, False)
+        shim.statuses["zones/1/4"] = 400
+        assert hub.data_setter_helper("zones/1/4", {"setpoint": 99}) is False
+        del shim.statuses["zones/1/4"]
+    assert hub.online
+    assert not hub.errors.outage
+
+
+def test_server_errors_open_and_answers_close_an_outage(shim, hub):
+    shim.statuses["zones/1/1"] = 500
+    for _ in range(OUTAGE_FAILURE_THRESHOLD):
+        assert hub.payload_getter_helper("zones/1/1") == (None, False)
+    assert not hub.online
+    assert hub.errors.outage
+    # A rejected request is an answer, the shim server is reachable again.
+    shim.statuses["zones/1/1"] = 404
+    assert hub.payload_getter_helper("zones/1/1") == (None, False)
+    assert hub.online
+    assert not hub.errors.outage
+
+
+def test_unanswered_requests_open_an_outage(hub):
+    hub.transport = type(hub.transport)("http://127.0.0.1:9")
+    hub.transport.set_timeout(1)
+    for _ in range(OUTAGE_FAILURE_THRESHOLD - 1):
+        assert hub.payload_getter_helper("zones/1/1") == (None, False)
+    assert hub.online
+    assert hub.data_setter_helper("zones/1/1", {"setpoint": 22.0}) is None
+    assert not hub.online
@@ -0,0 +1,53 @@
+"""Tests of the configured endpoints probe run by the config flow."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from custom_components.rehau_neasmart2.const import MAX_CONCURRENT_REQUESTS_LIMIT
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2ClimateControlSystem
+from tests.shim_server import ShimServer
+
+ZONE = {"state": 1, "setpoint": 21.5, "temperature": 20.3, "relative_humidity": 45}
+# Largest topology: 4 base stations of 12 zones.
+ZONES = ",".join(f"{b}{z:02d}" for b in range(1, 5) for z in range(1, 13))
+
+
+def probe(shim, deadline):
+    """Build a hub on the shim server with every zone, and probe its endpoints."""
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        # Home Assistant runs the executor jobs on many more threads than the pooled connections.
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=64))
+        hass = SimpleNamespace(
+            loop=loop, async_add_executor_job=lambda job, *args: loop.run_in_executor(None, job, *args)
+        )
+        hub = RehauNeasmart2ClimateControlSystem(
+            hass, "Test", "127.0.0.1", int(shim.base_url.rsplit(":", 1)[1]), ZONES, 3, "1,2,3,4,5", "1,2,3"
+        )
+        try:
+            return hub.endpoints, await hub.async_probe_endpoints(deadline)
+        finally:
+            hub.transport.close()
+
+    return asyncio.run(run())
+
+
+def test_probe_is_bounded_by_the_connection_pool():
+    with ShimServer({}) as shim:
+        shim.payloads.update({f"zones/{b}/{z}": dict(ZONE) for b in range(1, 5) for z in range(1, 13)})
+        shim.delays = {endpoint: 0.02 for endpoint in shim.payloads}
+        endpoints, latencies = probe(shim, 5)
+    assert len(endpoints) > MAX_CONCURRENT_REQUESTS_LIMIT
+    assert all(latencies[endpoint] is not None for endpoint in shim.payloads)
+    assert shim.max_in_flight <= MAX_CONCURRENT_REQUESTS_LIMIT
+    # Every request reuses one of the pooled connections.
+    assert shim.connections <= MAX_CONCURRENT_REQUESTS_LIMIT
+
+
+def test_spent_deadline_probes_nothing():
+    with ShimServer({}) as shim:
+        shim.payloads.update({f"zones/{b}/{z}": dict(ZONE) for b in range(1, 5) for z in range(1, 13)})
+        endpoints, latencies = probe(shim, 0)
+    assert latencies == dict.fromkeys(endpoints)
+    assert not shim.max_in_flight
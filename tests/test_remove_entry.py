@@ -0,0 +1,27 @@
+"""Tests of the removal of a deleted config entry data."""
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.rehau_neasmart2 import async_remove_entry
+from custom_components.rehau_neasmart2.const import WRITE_QUEUE_STORAGE_KEY, WRITE_QUEUE_STORAGE_VERSION
+
+
+def test_removal_deletes_the_queued_writes(tmp_path):
+    path = tmp_path / ".storage" / WRITE_QUEUE_STORAGE_KEY.format("removed")
+    kept = tmp_path / ".storage" / WRITE_QUEUE_STORAGE_KEY.format("kept")
+
+    async def run():
+        hass = HomeAssistant(str(tmp_path))
+        for entry_id in ("removed", "kept"):
+            store = Store(hass, WRITE_QUEUE_STORAGE_VERSION, WRITE_QUEUE_STORAGE_KEY.format(entry_id))
+            await store.async_save({"zones/1/1": {"setpoint": 21.5}})
+        assert path.exists()
+        await async_remove_entry(hass, SimpleNamespace(entry_id="removed"))
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
+    assert not path.exists()
+    assert kept.exists()
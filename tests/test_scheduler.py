@@ -0,0 +1,82 @@
+"""Tests of the prioritized request scheduler."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from types import SimpleNamespace
+
+from custom_components.rehau_neasmart2.const import PRIORITY_ALERT, PRIORITY_POLL, PRIORITY_WRITE
+from custom_components.rehau_neasmart2.hub import RehauNeasmart2RequestScheduler
+
+
+class Gateway:
+    """Blocking requests recording their order and how many run at once."""
+
+    def __init__(self, duration: float = 0.01) -> None:
+        self.duration = duration  # Seconds taken by each request.
+        self.order = []  # Names of the requests, in the order they started.
+        self.in_flight = 0  # Requests running.
+        self.max_in_flight = 0  # Most requests running at once since the last reset.
+        self._lock = threading.Lock()
+
+    def request(self, name: str) -> None:
+        with self._lock:
+            self.order.append(name)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.duration)
+        with self._lock:
+            self.in_flight -= 1
+
+
+def scheduler(max_concurrent: int) -> RehauNeasmart2RequestScheduler:
+    """Build a scheduler running the requests in the default executor of the running loop."""
+    loop = asyncio.get_running_loop()
+    # More threads than slots, as in Home Assistant, so the scheduler alone bounds the requests.
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=16))
+    hass = SimpleNamespace(loop=loop, async_add_executor_job=lambda job, *args: loop.run_in_executor(None, job, *args))
+    return RehauNeasmart2RequestScheduler(hass, max_concurrent)
+
+
+def test_queued_requests_by_priority():
+    gateway = Gateway()
+
+    async def run():
+        gate = scheduler(1)
+        # The first request takes the slot, the others queue.
+        jobs = [asyncio.ensure_future(gate.async_run(PRIORITY_POLL, gateway.request, "busy"))]
+        await asyncio.sleep(0)
+        for priority, name in [(PRIORITY_POLL, "poll 1"), (PRIORITY_ALERT, "alert"), (PRIORITY_POLL, "poll 2"),
+                               (PRIORITY_WRITE, "write")]:
+            jobs.append(asyncio.ensure_future(gate.async_run(priority, gateway.request, name)))
+        await asyncio.sleep(0)
+        await asyncio.gather(*jobs)
+        assert gate._active == 0
+
+    asyncio.run(run())
+    assert gateway.order == ["busy", "write", "alert", "poll 1", "poll 2"]
+
+
+def test_max_concurrent_changes_apply_to_the_queued_requests():
+    gateway = Gateway()
+
+    async def run():
+        gate = scheduler(8)
+        jobs = [asyncio.ensure_future(gate.async_run(PRIORITY_POLL, gateway.request, n)) for n in range(200)]
+        await asyncio.sleep(0.05)
+        assert gateway.max_in_flight == 8
+        gate.set_max_concurrent(1)
+        # Once the requests already running are done, a single one runs at a time.
+        await asyncio.sleep(0.05)
+        assert gate._active == 1
+        gateway.max_in_flight = gateway.in_flight
+        await asyncio.sleep(0.05)
+        assert gateway.max_in_flight == 1
+        gate.set_max_concurrent(4)
+        await asyncio.sleep(0.05)
+        assert gate._active == 4
+        assert gateway.max_in_flight == 4
+        await asyncio.gather(*jobs)
+        assert gate._active == 0
+
+    asyncio.run(run())
@@ -0,0 +1,369 @@
+"""Soak test running the hub and all its platforms for days of simulated time against a fake gateway.
+
+The integration is set up in a Home Assistant instance whose event loop clock is warped: whenever
+the loop has nothing ready it jumps to its next timer, so days of polling run in minutes. Executor
+jobs run one at a time while the loop waits, and complete after a simulated gateway latency. The
+gateway goes through outages, rejected requests and slow answers, its zones change at every
+refresh, and setpoints, presets and global modes are written along the way. Every simulated hour
+the memory blocks allocated by Python, the live objects, the event loop tasks left once the polls
+are done and the zones poll cycle latency are sampled, and the test fails when any of them trends
+upward after the warm-up.
+
+The soak takes about a minute per simulated day, so it only runs when SOAK_DAYS sets its duration:
+
+    SOAK_DAYS=2 python -m pytest tests/test_soak.py
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+import gc
+import logging
+import os
+import random
+import selectors
+import statistics
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.rehau_neasmart2 import hub as hub_module
+from custom_components.rehau_neasmart2.const import DOMAIN, PRESET_CLIMATE_MODES_MAPPING, PRESET_STATES_MAPPING
+from custom_components.rehau_neasmart2.hub import GatewayUnreachable
+
+# Simulated seconds between two samples of the resources.
+SAMPLE_INTERVAL = 3600
+# Simulated seconds excluded from the trends: cadence learning, registries and caches filling up.
+WARM_UP = 6 * 3600
+# Simulated seconds between two counts of the event loop tasks, the lowest count of each hour is sampled.
+TASKS_COUNT_INTERVAL = 60
+# Growth over the soak, relative to the median, above which a metric trends upward.
+GROWTH_THRESHOLDS = {"memory": 0.01, "objects": 0.01, "tasks": 0.05, "cycle_latency": 0.25}
+# Simulated seconds between two refreshes of the Sysbus data by the gateway.
+GATEWAY_REFRESH = 30
+# Topology of the soaked hub: one base station, a mixed group, a pump and a dehumidifier.
+TOPOLOGY = {"zones": ",".join(f"Zone {z}" for z in range(1, 13)), "mixed_groups": 1,
+            "pumps_regs_mapping": "1", "dehumidificators_regs_mapping": "1"}
+
+
+# Tell whether a series of samples trends upward.
+def trends_upward(values: list[float], threshold: float) -> bool:
+    """Return whether the values grow by more than threshold over the series, relatively to their median.
+
+    The growth is estimated with the median of the slopes between every two samples (Theil-Sen),
+    so a few spikes do not make a trend, and the median of the last quarter of the samples must
+    also be above the median of the first quarter.
+    """
+    count = len(values)
+    slope = statistics.median((values[j] - values[i]) / (j - i) for i in range(count) for j in range(i + 1, count))
+    quarter = max(count // 4, 1)
+    return slope * (count - 1) > threshold * max(abs(statistics.median(values)), 1e-9) and \
+        statistics.median(values[-quarter:]) > statistics.median(values[:quarter])
+
+
+class _WarpSelector(selectors.BaseSelector):
+    """Selector polling the real one without blocking, and advancing the clock by the timeout instead."""
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self.clock = 0.0  # Simulated monotonic time (seconds).
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if not events:
+            if timeout is None:
+                return self._selector.select(None)
+            self.clock += timeout
+        return events
+
+    def close(self) -> None:
+        self._selector.close()
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+class TimeWarpLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps to the next timer whenever nothing is ready."""
+
+    def __init__(self) -> None:
+        self._warp = _WarpSelector()
+        super().__init__(self._warp)
+
+    def time(self) -> float:
+        return self._warp.clock
+
+
+class InlineExecutor(ThreadPoolExecutor):
+    """Executor running one job at a time while the loop waits, completing it after its simulated duration.
+
+    The loop clock does not move while the job runs, on a worker thread so Home Assistant does
+    not take it for blocking I/O in the event loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, duration) -> None:
+        super().__init__(max_workers=1)
+        self._loop = loop
+        self._duration = duration  # Returns the simulated seconds taken by the job just run.
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        done = super().submit(fn, *args, **kwargs)
+        wait([done])
+        future = Future()
+        if done.exception() is None:
+            complete = partial(future.set_result, done.result())
+        else:
+            complete = partial(future.set_exception, done.exception())
+        self._loop.call_later(self._duration(), complete)
+        return future
+
+
+class FakeGateway:
+    """Fake Sysbus transport going through the failures of a real gateway over days.
+
+    It answers as the HTTP transport does: every request raises GatewayUnreachable during an
+    outage, health check included, a rejected endpoint answers (None, False) and its writes False.
+    Each request takes a simulated latency, a few of them close to the request timeout.
+    """
+
+    address = "fake gateway"  # Address of the gateway, used in logs.
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, seed: int = 0) -> None:
+        self.loop = loop
+        self.rnd = random.Random(seed)
+        self.payloads = gateway_payloads()  # Current payload of each endpoint.
+        self.down = False  # Whether an outage is running.
+        self.rejected = set()  # Endpoints rejecting the requests.
+        self.outages = 0  # Outages started.
+        self.rejections = 0  # Rejections started.
+        self._answered = {}  # Last payload answered for each endpoint.
+        self._requests = 0  # Requests made since the last billing.
+
+    def start(self) -> None:
+        self.loop.call_later(GATEWAY_REFRESH, self._refresh)
+        self.loop.call_later(self.rnd.uniform(3600, 4 * 3600), self._outage)
+        self.loop.call_later(self.rnd.uniform(600, 3600), self._rejection)
+
+    def check_online(self) -> bool:
+        self._request("health")
+        return True
+
+    def get(self, endpoint: str) -> tuple[dict | None, bool]:
+        self._request(endpoint)
+        if endpoint in self.rejected:
+            return None, False
+        previous = self._answered.get(endpoint)
+        if previous == self.payloads[endpoint]:
+            return previous, False
+        self._answered[endpoint] = dict(self.payloads[endpoint])
+        return self._answered[endpoint], True
+
+    def post(self, endpoint: str, payload: dict) -> bool:
+        self._request(endpoint)
+        if endpoint in self.rejected:
+            return False
+        self.payloads[endpoint] = {**self.payloads[endpoint], **payload}
+        return True
+
+    def set_endpoints(self, endpoints: list[str]) -> None:
+        for endpoint in set(self._answered) - set(endpoints):
+            del self._answered[endpoint]
+
+    def set_timeout(self, timeout: float) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def request_duration(self) -> float:
+        """Return the simulated seconds taken by the requests made since the last call."""
+        duration = sum(self.rnd.uniform(1.0, 3.0) if self.rnd.random() < 0.01 else self.rnd.uniform(0.02, 0.1)
+                       for _ in range(self._requests))
+        self._requests = 0
+        return duration
+
+    def _request(self, endpoint: str) -> None:
+        self._requests += 1
+        if self.down:
+            raise GatewayUnreachable(f"Error calling {self.address}/{endpoint}, code 503")
+
+    def _refresh(self) -> None:
+        for endpoint, payload in self.payloads.items():
+            if endpoint.startswith("zones/"):
+                payload["temperature"] = round(payload["temperature"] + self.rnd.uniform(-0.1, 0.1), 2)
+                payload["relative_humidity"] = min(max(payload["relative_humidity"] + self.rnd.randint(-1, 1), 30), 70)
+        outside = self.payloads["outsidetemperature"]
+        outside["outside_temperature"] = round(outside["outside_temperature"] + self.rnd.uniform(-0.2, 0.2), 2)
+        self.loop.call_later(GATEWAY_REFRESH, self._refresh)
+
+    def _outage(self) -> None:
+        self.outages += 1
+        self.down = True
+        self.loop.call_later(self.rnd.uniform(60, 1800), setattr, self, "down", False)
+        self.loop.call_later(self.rnd.uniform(3600, 8 * 3600), self._outage)
+
+    def _rejection(self) -> None:
+        self.rejections += 1
+        endpoint = self.rnd.choice(sorted(self.payloads))
+        self.rejected.add(endpoint)
+        self.loop.call_later(self.rnd.uniform(60, 900), self.rejected.discard, endpoint)
+        self.loop.call_later(self.rnd.uniform(600, 3600), self._rejection)
+
+
+# Build the payloads of every endpoint of the soaked topology.
+def gateway_payloads() -> dict[str, dict]:
+    """Return the endpoint -> payload mapping served by the fake gateway."""
+    payloads = {
+        "mode": {"mode": PRESET_CLIMATE_MODES_MAPPING["Auto"]},
+        "state": {"state": PRESET_STATES_MAPPING["Normal"]},
+        "outsidetemperature": {"outside_temperature": 7.4, "filtered_outside_temperature": 7.6},
+        "notifications": {"hints_present": False, "warnings_present": False, "error_present": False},
+        "mixedgroups/1": {"pump_state": 1, "mixing_valve_opening_percentage": 40,
+                          "flow_temperature": 32.5, "return_temperature": 27.1},
+        "pumps/1": {"pump_state": 1},
+        "dehumidifiers/1": {"dehumidifier_state": 0},
+    }
+    for z in range(1, 13):
+        payloads[f"zones/1/{z}"] = {"state": PRESET_STATES_MAPPING["Normal"], "setpoint": 21.0,
+                                    "temperature": 20.0 + z / 10, "relative_humidity": 45}
+    return payloads
+
+
+class _CountingHandler(logging.Handler):
+    """Handler formatting and counting the records, keeping none of them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts = {}  # Records emitted at each level.
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+        self.counts[record.levelname] = self.counts.get(record.levelname, 0) + 1
+
+
+async def _async_soak(tmp_path, gateway: FakeGateway, duration: float, samples: dict[str, list[float]]) -> None:
+    """Run the integration against the gateway for the simulated duration, sampling its resources every hour."""
+    loop = asyncio.get_running_loop()
+    hass = HomeAssistant(str(tmp_path))
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await bootstrap.load_registries(hass)
+    hass.state = CoreState.running
+
+    entry = config_entries.ConfigEntry(
+        version=1, domain=DOMAIN, title="Soak", source=config_entries.SOURCE_USER,
+        data={"climate_system_name": "Soak", "neasmart_gw_server_host": "127.0.0.1",
+              "neasmart_gw_server_port": 80, **TOPOLOGY},
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    registry = er.async_get(hass)
+    thermostats = [e.entity_id for e in registry.entities.values() if e.domain == "climate"]
+    selects = {e.unique_id.rsplit("_", 1)[-1]: e.entity_id for e in registry.entities.values() if e.domain == "select"}
+    assert len(hass.states.async_all()) == len([e for e in registry.entities.values() if not e.disabled])
+    assert len(thermostats) == 12 and len(selects) == 2
+
+    async def write() -> None:
+        rnd = gateway.rnd
+        choice = rnd.random()
+        if choice < 0.6:
+            await hass.services.async_call("climate", "set_temperature", {
+                "entity_id": rnd.choice(thermostats), "temperature": rnd.choice([20.5, 21.0, 21.5])}, blocking=True)
+        elif choice < 0.8:
+            await hass.services.async_call("climate", "set_preset_mode", {
+                "entity_id": rnd.choice(thermostats), "preset_mode": rnd.choice(["Normal", "Reduced"])}, blocking=True)
+        else:
+            await hass.services.async_call("select", "select_option", {
+                "entity_id": selects["mode"], "option": rnd.choice(["Auto", "Heating"])}, blocking=True)
+        loop.call_later(rnd.uniform(300, 1800), lambda: hass.async_create_task(write()))
+
+    gateway.start()
+    loop.call_later(gateway.rnd.uniform(300, 1800), lambda: hass.async_create_task(write()))
+    for _ in range(int(duration // SAMPLE_INTERVAL)):
+        # The tasks of the polls in flight come and go, the ones left behind raise the floor.
+        tasks = []
+        for _ in range(SAMPLE_INTERVAL // TASKS_COUNT_INTERVAL):
+            await asyncio.sleep(TASKS_COUNT_INTERVAL)
+            tasks.append(len(asyncio.all_tasks()))
+        gc.collect()
+        samples["memory"].append(sys.getallocatedblocks())
+        samples["objects"].append(len(gc.get_objects()))
+        samples["tasks"].append(min(tasks))
+        samples["cycle_latency"].append(statistics.fmean(samples.pop("cycles", None) or [0]))
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.skipif("SOAK_DAYS" not in os.environ, reason="set SOAK_DAYS to the simulated days of the soak")
+def test_soak(tmp_path, monkeypatch):
+    duration = float(os.environ["SOAK_DAYS"]) * 86400
+    samples = {metric: [] for metric in GROWTH_THRESHOLDS}
+    loop = TimeWarpLoop()
+    gateway = FakeGateway(loop)
+    loop.set_default_executor(InlineExecutor(loop, gateway.request_duration))
+    monkeypatch.setattr(hub_module, "RehauNeasmart2HttpTransport", lambda base_url, socket_path=None: gateway)
+    # The hub measures its ages and deadlines on the simulated clock.
+    monkeypatch.setattr(hub_module, "time", SimpleNamespace(monotonic=loop.time))
+
+    poll = hub_module.RehauNeasmart2ClimateControlSystem._async_cadence_poll
+
+    async def timed_poll(self, _now=None) -> None:
+        start = loop.time()
+        await poll(self, _now)
+        samples.setdefault("cycles", []).append(loop.time() - start)
+
+    monkeypatch.setattr(hub_module.RehauNeasmart2ClimateControlSystem, "_async_cadence_poll", timed_poll)
+
+    # Keep the records away from the pytest capture, which would hold all of them until the end of the test.
+    logs = _CountingHandler()
+    loggers = [logging.getLogger("custom_components"), logging.getLogger("homeassistant")]
+    for logger in loggers:
+        monkeypatch.setattr(logger, "propagate", False)
+        logger.addHandler(logs)
+    try:
+        loop.run_until_complete(_async_soak(tmp_path, gateway, duration, samples))
+    finally:
+        for logger in loggers:
+            logger.removeHandler(logs)
+        loop.close()
+    # The failures did happen, and were reported.
+    assert gateway.outages and gateway.rejections and logs.counts.get("ERROR"), \
+        f"{gateway.outages} outages, {gateway.rejections} rejections, log records {logs.counts}"
+    warm_up = WARM_UP // SAMPLE_INTERVAL
+    trending = {}
+    for metric, threshold in GROWTH_THRESHOLDS.items():
+        values = samples[metric][warm_up:]
+        if trends_upward(values, threshold):
+            trending[metric] = values
+    assert not trending, f"Trending upward: {trending}, samples: {samples}"
+
+
+def test_trend_detection():
+    rnd = random.Random(0)
+    flat = [100 + rnd.uniform(-5, 5) for _ in range(42)]
+    leaking = [100 + i * 0.5 + rnd.uniform(-5, 5) for i in range(42)]
+    spiking = flat[:36] + [300, 300] + flat[38:]
+    stepping = [4] * 20 + [5] * 22
+    assert not trends_upward(flat, 0.05)
+    assert trends_upward(leaking, 0.05)
+    assert not trends_upward(spiking, 0.05)
+    assert trends_upward(stepping, 0.05)